@@ -3,6 +3,7 @@
 # Game settings
 GAME_CONFIG = {
     "hands": 500,           # Number of hands to play
+    "tables": 1,           # Independent tables to run concurrently
     "blinds": (1, 2),   # Small blind, big blind
     "initial_stack": 1000,  # Starting stack for each player
     "rng_seed": 42,        # Random seed for reproducibility
@@ -10,6 +11,11 @@ GAME_CONFIG = {
     "min_bet": 2,          # Minimum bet amount
     "ante_amount": 0,      # Ante amount per player (0 for no ante)
     "enable_reflection": False,  # Enable hand reflection for all players
+    "enable_decision_plans": True,  # Let players pre-plan street follow-ups to skip LLM calls
+    "enable_decision_cache": True,  # Reuse stored responses for exactly repeated spots
+    "enable_delta_prompts": True,  # Send only state changes after a player's first turn of a hand
+
+
 }
 
 # Player configurations - easy to modify
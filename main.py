@@ -25,14 +25,26 @@ honestly just turn off notes and memory for now
 """
 
 import asyncio
+import atexit
+import functools
+import logging
+import logging.handlers
+import os
+import queue
 import random
+import re
+from pathlib import Path
 from typing import Any, Dict, List
 
+from utils import fast_json
+
 from pokerkit import Automation, Mode, NoLimitTexasHoldem
 from pokerkit.state import HoleCardsShowingOrMucking, BetCollection, BlindOrStraddlePosting, CardBurning, HoleDealing, ChipsPulling, ChipsPushing
 from players.player_factory import PlayerFactory
+from players.openai_player import close_shared_openai_client, prewarm_shared_openai_client
 from utils.action_converter import ActionConverter
 from utils.action_parser import InvalidActionError, parse_player_decision, select_fallback_token
+from utils.decision_cache import DecisionCache
 from game_config import GAME_CONFIG, PLAYER_CONFIGS
 
 # Game configuration - all values now read from GAME_CONFIG
@@ -41,29 +53,156 @@ MIN_BET = GAME_CONFIG["min_bet"]
 RNG_SEED = GAME_CONFIG["rng_seed"]
 ANTE_AMOUNT = GAME_CONFIG["ante_amount"]
 SEE_MODEL_MONOLOGUE = GAME_CONFIG["see_model_monologue"]
+ENABLE_DECISION_PLANS = GAME_CONFIG.get("enable_decision_plans", False)
+ENABLE_DELTA_PROMPTS = GAME_CONFIG.get("enable_delta_prompts", False)
+
+
+def _setup_hand_logger() -> logging.Logger:
+    """Hand-progress logger whose writes happen on a background thread.
+
+    Under concurrent tables, stdout writes on the event loop stall every
+    in-flight LLM call; a QueueHandler makes logging from the loop a cheap
+    enqueue and a QueueListener thread does the actual I/O.
+    """
+    logger = logging.getLogger("hand")
+    if logger.handlers:
+        return logger
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+_HAND_LOG = _setup_hand_logger()
+
+# Single-pass classifier for canonical action tokens; compiled once so the
+# betting loop never re-runs a startswith chain plus a split per turn
+_TOKEN_RE = re.compile(r"^(?P<act>fold|check|call|raise_to|show|muck)(?:\s*:\s*(?P<amt>\d+))?$")
+
+# Card rendering tables built once at import: all 52 shorthand strings map
+# straight to their emoji form, so per-turn rendering is a dict hit
+_SUIT_EMOJI = {'S': '♠️', 'H': '♥️', 'D': '♦️', 'C': '♣️'}
+_CARD_EMOJI = {
+    f"{rank}{suit}": f"{rank}{_SUIT_EMOJI[suit.upper()]}"
+    for rank in "23456789TJQKA"
+    for suit in "shdc"
+}
+
+
+# Decision plans: a player may append a 'PLAN:' line predicting its follow-up
+# action for the rest of the street. When the opponent's response matches the
+# predicted branch, the stored action is played without another LLM
+# round-trip, roughly halving API calls on plan hits.
+PLAN_INSTRUCTIONS = (
+    "You may add a final line 'PLAN: if_checked=<token>; if_called=<token>; "
+    "if_raised=<token>' predicting your next action on this street for each "
+    "possible opponent response. If the opponent's action matches a branch, "
+    "your planned action is played automatically without asking you again."
+)
+
+_PLAN_BRANCHES = {"check": "if_checked", "call": "if_called"}
+
+# Operation types hidden from the per-turn console log; built once instead of
+# per loop iteration
+_FILTERED_OPS = (BetCollection, CardBurning, HoleDealing, ChipsPulling, BlindOrStraddlePosting)
+
+
+def _extract_plan(raw_response: str):
+    """Parse a 'PLAN: if_x=<token>; ...' line into a branch → token dict."""
+    for line in raw_response.splitlines():
+        line = line.strip()
+        if line.upper().startswith("PLAN:"):
+            plan = {}
+            for part in line[5:].split(";"):
+                if "=" in part:
+                    branch, token = part.split("=", 1)
+                    plan[branch.strip().lower()] = token.strip()
+            return plan or None
+    return None
+
+
+def _plan_branch(last_action):
+    """Map the opponent's most recent action to the matching plan branch."""
+    if last_action is None:
+        return None
+    act = last_action["action"]
+    if act.startswith("raise_to"):
+        return "if_raised"
+    return _PLAN_BRANCHES.get(act)
+
+
+@functools.lru_cache(maxsize=128)
+def card_to_emoji(card_str):
+    """Convert a card (or its string form) to an emoji string."""
+    if not isinstance(card_str, str):
+        card_str = str(card_str)
+
+    if '(' in card_str and ')' in card_str:
+        short = card_str.split('(')[1].split(')')[0]
+        emoji = _CARD_EMOJI.get(short)
+        if emoji is not None:
+            return emoji
+        rank, suit = short[:-1], short[-1]
+        return f"{rank}{_SUIT_EMOJI[suit.upper()]}"
+    return _CARD_EMOJI.get(card_str, card_str)
+
+
 class PromptAdapter:
     """Helpers for state → prompt and token → state transition."""
     
     @staticmethod
     def visible_state(st, player: int, player_names=None) -> Dict[str, Any]:
-        def card_str_list(cards):
-            return [str(card) for card in cards]
-
-        def action_str(op):
-            return ActionConverter.to_human_readable(op, player_names)
-
         # Safety check for player index
         if player is None:
             raise ValueError("Player index cannot be None in visible_state")
 
+        # Card string lists are cached on the state alongside _pa_history:
+        # the board only changes at street boundaries and hole cards never
+        # change within a hand, so re-running str() on every card each turn
+        # is wasted work
+        board_key = (st.street_index, len(st.board_cards))
+        if getattr(st, "_pa_board_key", None) != board_key:
+            st._pa_board = list(map(str, st.get_board_cards(0)))
+            st._pa_board_key = board_key
+        hole_cache = getattr(st, "_pa_hole", None)
+        if hole_cache is None:
+            hole_cache = st._pa_hole = {}
+        hole_strs = hole_cache.get(player)
+        if hole_strs is None:
+            hole_strs = hole_cache[player] = list(map(str, st.hole_cards[player]))
+
         street_map = {0: "Pre flop", 1: "Flop", 2: "Turn", 3: "River"}
         street_name = street_map.get(st.street_index, "Unknown")
 
-        if st.can_complete_bet_or_raise_to(st.min_completion_betting_or_raising_to_amount):
-            min_raise = st.min_completion_betting_or_raising_to_amount
+        min_raise_to = st.min_completion_betting_or_raising_to_amount
+        if st.can_complete_bet_or_raise_to(min_raise_to):
+            min_raise = min_raise_to
         else:
             min_raise = 'Cannot Raise'
 
+        # Incremental history: render only the operations added since the
+        # previous call and keep the formatted lines on the state itself, so
+        # per-turn work is O(new ops) rather than re-walking the whole hand
+        history = getattr(st, "_pa_history", None)
+        if history is None:
+            history = []
+            st._pa_history = history
+            st._pa_history_len = 0
+        ops = st.operations
+        if len(ops) > st._pa_history_len:
+            for readable in ActionConverter.to_human_readable_many(
+                ops[st._pa_history_len:], player_names
+            ):
+                if readable is not None:
+                    history.append(readable)
+            st._pa_history_len = len(ops)
+
         # Position logic for multiple players
         player_count = len(st.stacks)
         if player_count == 2:
@@ -80,20 +219,54 @@ class PromptAdapter:
         return {
             "Current Street": street_name,
             "Position": position,
-            "board": card_str_list(st.get_board_cards(0)),
-            "Hole Cards": card_str_list(st.hole_cards[player]),
+            "board": st._pa_board,
+            "Hole Cards": hole_strs,
             "Your stack": st.stacks[player],
             "Opponent stacks": opponent_stacks,
             "Pot size": st.total_pot_amount,
             "to_call": st.checking_or_calling_amount if st.can_check_or_call() else 0,
             "min_raise_to": min_raise,
-            "history": [action_str(op) for op in st.operations if action_str(op) is not None]
+            "history": history.copy()
         }
 
+    # Fields that actually move between two decisions by the same player;
+    # everything else (hole cards, full history) is already in the player's
+    # conversation from the first prompt of the hand
+    _DELTA_KEYS = (
+        "Current Street",
+        "Position",
+        "board",
+        "Your stack",
+        "Opponent stacks",
+        "Pot size",
+        "to_call",
+        "min_raise_to",
+    )
+
+    @staticmethod
+    def delta_state(full_state: Dict[str, Any], history_sent) -> Dict[str, Any]:
+        """Shrink a repeat-turn payload to what changed since the last prompt.
+
+        The first prompt of a hand carries the full state; that message stays
+        in the player's conversation history, so later turns only need the
+        fields that move between decisions plus the history lines added since
+        `history_sent`. Pass ``history_sent=None`` for the first turn to get
+        the full state back unchanged.
+        """
+        if history_sent is None:
+            return full_state
+        delta = {k: full_state[k] for k in PromptAdapter._DELTA_KEYS}
+        delta["new_history"] = full_state["history"][history_sent:]
+        delta["delta_update"] = (
+            "Only what changed since your previous decision this hand; your "
+            "hole cards and earlier history are unchanged from the state above."
+        )
+        return delta
+
     @staticmethod
     def legal_tokens(st):
         tokens = []
-        if st.can_fold():              
+        if st.can_fold():
             tokens.append("fold")
         if st.can_check_or_call():
             if st.checking_or_calling_amount == 0:
@@ -102,11 +275,13 @@ class PromptAdapter:
                 tok = f"call"
             tokens.append(tok)
 
-        if st.can_complete_bet_or_raise_to(st.min_completion_betting_or_raising_to_amount):
-            min_raise = st.min_completion_betting_or_raising_to_amount
+        # Hoist the repeated property lookup into a local
+        min_raise = st.min_completion_betting_or_raising_to_amount
+        if st.can_complete_bet_or_raise_to(min_raise):
             # Only include raise option if we have a valid actor_index
-            if st.actor_index is not None:
-                tokens.append(f"raise_to: {min_raise} to {st.stacks[st.actor_index]}")
+            actor = st.actor_index
+            if actor is not None:
+                tokens.append(f"raise_to: {min_raise} to {st.stacks[actor]}")
 
         # Add showdown options
 
@@ -118,22 +293,25 @@ class PromptAdapter:
 
     @staticmethod
     def apply_token(st, tok: str):
-        if tok == "fold":
+        m = _TOKEN_RE.match(tok.strip())
+        if m is None:
+            raise ValueError(tok)
+        act = m["act"]
+        if act == "fold":
             st.fold()
-        elif tok.startswith("check") or tok.startswith("call"):
+        elif act == "check" or act == "call":
             st.check_or_call()
-        elif tok.startswith("raise_to"):
-            st.complete_bet_or_raise_to(int(tok.split(":")[1].strip()))
-        elif tok == "show":
+        elif act == "raise_to":
+            if m["amt"] is None:
+                raise ValueError(tok)
+            st.complete_bet_or_raise_to(int(m["amt"]))
+        elif act == "show":
             # Use showdown_index if actor_index is None (showdown phase)
             player_idx = st.actor_index if st.actor_index is not None else st.showdown_index
             st.show_or_muck_hole_cards(True, player_idx)
-        elif tok == "muck":
-            # Use showdown_index if actor_index is None (showdown phase)
+        else:  # muck
             player_idx = st.actor_index if st.actor_index is not None else st.showdown_index
             st.show_or_muck_hole_cards(False, player_idx)
-        else:
-            raise ValueError(tok)
 
 ############################################################
 # ─────────────────  GAME ORCHESTRATOR  ───────────────────
@@ -142,9 +320,15 @@ class PromptAdapter:
 class GameOrchestrator:
     """Simplified game orchestrator using the player factory."""
 
-    def __init__(self, hands: int = 1):
+    def __init__(self, hands: int = 1, hand_limit: asyncio.Semaphore = None):
         self.hands = hands
         self.rng = random.Random(RNG_SEED)
+        # Bounds how many hands play at once across all tables. Hands on one
+        # table stay sequential (stacks carry over), so the semaphore only
+        # matters when several tables run concurrently via run_tables().
+        self.hand_limit = hand_limit or asyncio.Semaphore(
+            int(os.getenv("MAX_CONCURRENT_HANDS", "5"))
+        )
         
         # Create players using the factory
         self.players = []
@@ -166,6 +350,11 @@ class GameOrchestrator:
         self.pnl_tracker = PnLTracker()
         self.pnl_tracker.initialize_players(self.players)
 
+        # On-disk cache of LLM decisions for exactly repeated spots
+        self.decision_cache = (
+            DecisionCache() if GAME_CONFIG.get("enable_decision_cache", True) else None
+        )
+
     def _make_state(self):
         """Create a fresh PokerKit state."""
         stacks = tuple(player.stack for player in self.get_players_in_position_order())
@@ -214,39 +403,27 @@ class GameOrchestrator:
                 for i in range(len(self.players))]
     
     def card_to_emoji(self, card_str):
-        """Convert a card string to an emoji."""
-        suit_map = {
-            'S': '♠️', 'H': '♥️', 'D': '♦️', 'C': '♣️'
-        }
-
-        if not isinstance(card_str, str):
-            card_str = str(card_str)
-        
-        if '(' in card_str and ')' in card_str:
-            card_str = card_str.split('(')[1].split(')')[0]
-            rank, suit = card_str[:-1], card_str[-1]
-            suit = suit.upper()
-            return f"{rank}{suit_map[suit]}"
-        return card_str
+        """Convert a card string to an emoji (cached module-level helper)."""
+        return card_to_emoji(card_str)
 
     async def _play_hand(self, hand_no: int):
         """Play a single hand."""
         st = self._make_state()
-        last_board = []
+        last_board_key = (None, 0)
         last_history_len = len(st.operations)  # Initialize to current operations to avoid showing setup actions
         
-        print(f"\n=== Hand {hand_no} ===")
+        _HAND_LOG.info(f"\n=== Hand {hand_no} ===")
         
         # Get players in position order for this hand
         players_in_position = self.get_players_in_position_order()
         player_names = [p.name for p in players_in_position]
         if len(players_in_position) == 2:
-            print(f"Button: {players_in_position[0].name} (SB), BB: {players_in_position[1].name}")
+            _HAND_LOG.info(f"Button: {players_in_position[0].name} (SB), BB: {players_in_position[1].name}")
         else:
-            print(f"Button: {players_in_position[0].name}, SB: {players_in_position[1].name}, BB: {players_in_position[2].name}")
+            _HAND_LOG.info(f"Button: {players_in_position[0].name}, SB: {players_in_position[1].name}, BB: {players_in_position[2].name}")
             if len(players_in_position) > 3:
                 for i in range(3, len(players_in_position)):
-                    print(f"  Player {i}: {players_in_position[i].name}")
+                    _HAND_LOG.info(f"  Player {i}: {players_in_position[i].name}")
         
         # Track hand data
         hand_data = {
@@ -272,8 +449,8 @@ class GameOrchestrator:
             actual_player_idx = (i + self.dealer_position) % len(self.players)
             hole_cards = list(st.hole_cards[i])
             hand_data["hole_cards"][i] = hole_cards  # Store for later summary
-            print(f"P{i}, aka {self.players[actual_player_idx].name} hole cards:", 
-                  [self.card_to_emoji(card) for card in hole_cards])
+            _HAND_LOG.info(f"P{i}, aka {self.players[actual_player_idx].name} hole cards: "
+                  f"{[self.card_to_emoji(card) for card in hole_cards]}")
         
         # Betting loop - Continue until state is complete (st.status = False)
         # When all players are all-in before the river, PokerKit automation needs to:
@@ -292,6 +469,13 @@ class GameOrchestrator:
         # Track iterations to prevent infinite loops
         loop_iterations = 0
         max_iterations = 1000  # Safety limit
+
+        # One-shot decision plans stored per (player, street); see
+        # PLAN_INSTRUCTIONS
+        plans = {}
+
+        # Length of the history list each player last saw, for delta prompts
+        sent_history = {}
         
         while st.status and loop_iterations < max_iterations:
             loop_iterations += 1
@@ -354,8 +538,51 @@ class GameOrchestrator:
                 # This is a showdown decision
                 rsp = await self.players[actual_player_idx].make_showdown_decision(game_state, legal)
             else:
-                # Regular betting decision
-                rsp = await self.players[actual_player_idx].make_decision(game_state, legal)
+                rsp = None
+                plan_key = (actual_player_idx, st.street_index)
+                if ENABLE_DECISION_PLANS:
+                    # Consume a stored plan when the opponent's response
+                    # matches the predicted branch - no LLM round-trip
+                    plan = plans.pop(plan_key, None)
+                    if plan is not None:
+                        last_action = hand_data["actions"][-1] if hand_data["actions"] else None
+                        planned = plan.get(_plan_branch(last_action))
+                        if planned:
+                            try:
+                                parse_player_decision(planned, legal, game_state)
+                                rsp = f"{planned}@Following stored plan."
+                                _HAND_LOG.info(f"{player_name} follows plan: {planned}")
+                            except InvalidActionError:
+                                rsp = None
+                    game_state["plan_instructions"] = PLAN_INSTRUCTIONS
+                cache_key = None
+                if rsp is None and self.decision_cache is not None:
+                    # Exactly repeated spots replay the cached response
+                    # instead of paying another API round-trip
+                    cache_key = DecisionCache.key(
+                        self.players[actual_player_idx].model,
+                        game_state,
+                        legal,
+                        self.players[actual_player_idx].notes,
+                    )
+                    rsp = self.decision_cache.get(cache_key)
+                if rsp is None:
+                    # Regular betting decision. After a player's first prompt
+                    # of the hand, send only the delta since their last turn -
+                    # the conversation history already carries the full state
+                    prompt_state = game_state
+                    if ENABLE_DELTA_PROMPTS:
+                        prompt_state = PromptAdapter.delta_state(
+                            game_state, sent_history.get(actual_player_idx)
+                        )
+                        sent_history[actual_player_idx] = len(game_state["history"])
+                    rsp = await self.players[actual_player_idx].make_decision(prompt_state, legal)
+                    if cache_key is not None:
+                        self.decision_cache.put(cache_key, rsp)
+                    if ENABLE_DECISION_PLANS:
+                        new_plan = _extract_plan(rsp)
+                        if new_plan is not None:
+                            plans[plan_key] = new_plan
             
             # Parse response
             auto_corrected = False
@@ -364,7 +591,7 @@ class GameOrchestrator:
                 decision = parse_player_decision(rsp, legal, game_state)
             except InvalidActionError as err:
                 fallback_token = select_fallback_token(legal)
-                print(f"ILLEGAL MOVE from {player_name}: {err}. Using fallback '{fallback_token}'.")
+                _HAND_LOG.info(f"ILLEGAL MOVE from {player_name}: {err}. Using fallback '{fallback_token}'.")
                 self.players[actual_player_idx].illegal_moves += 1
                 auto_corrected = True
                 decision = parse_player_decision(fallback_token, legal, game_state)
@@ -372,7 +599,7 @@ class GameOrchestrator:
                     decision.commentary = "Auto-selected fallback action after invalid response."
             
             if SEE_MODEL_MONOLOGUE and decision.commentary:
-                print(f"{player_name}: {decision.commentary}")
+                _HAND_LOG.info(f"{player_name}: {decision.commentary}")
 
             hand_data["actions"].append({
                 "player": actual_player_idx,
@@ -382,54 +609,14 @@ class GameOrchestrator:
                 "auto_corrected": auto_corrected,
             })
 
-            try:               
+            # decision.token was already validated against the engine's own
+            # can_* predicates upstream (legal_tokens + parse_player_decision),
+            # so the guard covers only the PokerKit call itself; the logging
+            # below runs outside it on the plain, exception-free path
+            try:
                 PromptAdapter.apply_token(st, decision.token)
-
-                # After applying an operation, PokerKit processes automation synchronously
-                # Automation will:
-                # 1. Deal board cards (if Automation.BOARD_DEALING enabled)
-                # 2. Show cards (if Automation.HOLE_CARDS_SHOWING_OR_MUCKING enabled - but we disabled it)
-                # 3. Push chips (if Automation.CHIPS_PUSHING enabled)
-                # 
-                # These happen automatically within the apply_token call, so by the time we
-                # check st.status again, automation should have processed.
-                
-                # Print new developments
-                board = [str(card) for card in st.get_board_cards(0)]                
-                    
-                # Print new actions (check for operations added by automation)
-                if len(st.operations) > last_history_len:
-                    filtered_ops = (BetCollection, CardBurning, HoleDealing, ChipsPulling, BlindOrStraddlePosting)                    
-                    
-                    for op in st.operations[last_history_len:]:
-                        if isinstance(op, HoleCardsShowingOrMucking):
-                            actual_player = (op.player_index + self.dealer_position) % len(self.players)
-                            if op.hole_cards:
-                                # Player showed their cards
-                                cards_str = [str(card) for card in op.hole_cards]
-                                emoji_cards = [self.card_to_emoji(card) for card in cards_str]
-                                print(f"Player {self.players[actual_player].name} shows: {emoji_cards}")
-                            else:
-                                # Player mucked their hand
-                                print(f"Player {self.players[actual_player].name} mucks hand")
-                        elif not isinstance(op, filtered_ops):
-                            readable_action = ActionConverter.to_human_readable(op, player_names)
-                            if readable_action and readable_action.strip():  # Only print if there's actually something to show
-                                print(f"Action: {readable_action}")
-
-                if board != last_board:
-                    print(f"Board: {[self.card_to_emoji(card) for card in board]}")
-                    last_board = board.copy()
-                    hand_data["final_board"] = board.copy()
-
-                last_history_len = len(st.operations)
-                
-                # After applying an operation, check if state is still active
-                # If status became False, automation completed successfully
-                # If status is still True but no player needs to act, we'll handle it in the loop
-
             except Exception as e:
-                print(f"Error in hand {hand_no}: {e}")
+                _HAND_LOG.info(f"Error in hand {hand_no}: {e}")
                 # Don't try to fold if there's no player to act
                 if st.actor_index is not None or st.showdown_index is not None:
                     try:
@@ -437,6 +624,56 @@ class GameOrchestrator:
                     except:
                         pass
 
+            # After applying an operation, PokerKit processes automation synchronously
+            # Automation will:
+            # 1. Deal board cards (if Automation.BOARD_DEALING enabled)
+            # 2. Show cards (if Automation.HOLE_CARDS_SHOWING_OR_MUCKING enabled - but we disabled it)
+            # 3. Push chips (if Automation.CHIPS_PUSHING enabled)
+            #
+            # These happen automatically within the apply_token call, so by the time we
+            # check st.status again, automation should have processed.
+
+            # Log new actions (check for operations added by automation).
+            # Lines for this turn are batched into one log record so the
+            # listener thread does a single write per turn.
+            turn_lines = []
+            if len(st.operations) > last_history_len:
+                for op in st.operations[last_history_len:]:
+                    if isinstance(op, HoleCardsShowingOrMucking):
+                        actual_player = (op.player_index + self.dealer_position) % len(self.players)
+                        if op.hole_cards:
+                            # Player showed their cards
+                            cards_str = [str(card) for card in op.hole_cards]
+                            emoji_cards = [self.card_to_emoji(card) for card in cards_str]
+                            turn_lines.append(f"Player {self.players[actual_player].name} shows: {emoji_cards}")
+                        else:
+                            # Player mucked their hand
+                            turn_lines.append(f"Player {self.players[actual_player].name} mucks hand")
+                    elif not isinstance(op, _FILTERED_OPS):
+                        readable_action = ActionConverter.to_human_readable(op, player_names)
+                        if readable_action and readable_action.strip():  # Only log if there's actually something to show
+                            turn_lines.append(f"Action: {readable_action}")
+
+            # The board only grows at street boundaries, so a cheap
+            # (street, card-count) key detects changes without
+            # re-stringifying every card each turn
+            board_key = (st.street_index, len(st.board_cards))
+            if board_key != last_board_key:
+                board = [str(card) for card in st.get_board_cards(0)]
+                if board:
+                    turn_lines.append(f"Board: {[self.card_to_emoji(card) for card in board]}")
+                    hand_data["final_board"] = board
+                last_board_key = board_key
+
+            if turn_lines:
+                _HAND_LOG.info("\n".join(turn_lines))
+
+            last_history_len = len(st.operations)
+
+            # After applying an operation, check if state is still active
+            # If status became False, automation completed successfully
+            # If status is still True but no player needs to act, we'll handle it in the loop
+
         # Showdown & settle pots
         # Validate that winners showed their cards (poker rule: if you win, you must show)
         players_who_showed = set()
@@ -465,12 +702,12 @@ class GameOrchestrator:
             for pos_idx in winners_who_mucked:
                 actual_player_idx = (pos_idx + self.dealer_position) % len(self.players)
                 player_name = self.players[actual_player_idx].name
-                print(f"⚠️  WARNING: {player_name} won the pot but mucked their hand! This violates poker rules.")
-                print(f"   In real poker, you must show your cards to claim the pot.")
+                _HAND_LOG.info(f"⚠️  WARNING: {player_name} won the pot but mucked their hand! This violates poker rules.")
+                _HAND_LOG.info(f"   In real poker, you must show your cards to claim the pot.")
         
         players_in_position = self.get_players_in_position_order()
         result_str = " | ".join([f"{players_in_position[i].name}={st.stacks[i]}" for i in range(len(st.stacks))])
-        print(f"Hand {hand_no} result → stacks: {result_str}")
+        _HAND_LOG.info(f"Hand {hand_no} result → stacks: {result_str}")
         
         # Update hand result data
         hand_data["result"] = {
@@ -496,21 +733,28 @@ class GameOrchestrator:
 
     async def run(self):
         """Run the complete game."""
-       
-        for h in range(self.hands):
-            # Check if any player is eliminated before starting the hand
-            active_players = [p for p in self.players if p.stack > 0]
-            if len(active_players) < 2:
-                eliminated_players = [p.name for p in self.players if p.stack == 0]
-                print(f"\nGame ended early: Players eliminated: {eliminated_players}")
-                print(f"Remaining hands skipped: {self.hands - h}")
-                break
-                
-            await self._play_hand(h)
-        
+
+        try:
+            for h in range(self.hands):
+                # Check if any player is eliminated before starting the hand
+                active_players = [p for p in self.players if p.stack > 0]
+                if len(active_players) < 2:
+                    eliminated_players = [p.name for p in self.players if p.stack == 0]
+                    print(f"\nGame ended early: Players eliminated: {eliminated_players}")
+                    print(f"Remaining hands skipped: {self.hands - h}")
+                    break
+
+                async with self.hand_limit:
+                    await self._play_hand(h)
+        finally:
+            # Persist the decision cache so the next run reuses responses
+            if self.decision_cache is not None:
+                self.decision_cache.save()
+
         # Print performance summary
         print("\n=== Performance Summary ===")
-        
+
+        summary = {"hands": self.hands, "players": {}}
         for idx, player in enumerate(self.players):
             wins = 0
             for hand in player.hand_history:
@@ -518,24 +762,74 @@ class GameOrchestrator:
                 player_position = (idx - dealer_pos) % len(self.players)
                 if hand["result"].get(f"profit_p{player_position}", 0) > 0:
                     wins += 1
-            
+
             profit = player.stack - player.initial_stack
             win_rate = (wins / self.hands * 100) if self.hands > 0 else 0
-            
+            summary["players"][player.name] = {
+                "wins": wins,
+                "profit": profit,
+                "illegal_moves": player.illegal_moves,
+            }
+
             print(f"{player.name}: {wins}/{self.hands} wins ({win_rate:.1f}%), Profit: {profit}")
             print(f"Illegal moves: {player.illegal_moves}")
             if player.notes:
                 print(f"  Notes: {player.notes}")
-        
+
         # Print PnL tracking file location
         print(f"\n=== PnL Tracking ===")
         print(f"  CSV file: {self.pnl_tracker.get_csv_path()}")
         print(f"  Use this file to graph cumulative PnL over hands")
 
+        return summary
+
 ############################################################
 # ─────────────────────  MAIN  ─────────────────────────────
 ############################################################
 
+class TournamentRunner:
+    """Runs a batch of independent tables and journals per-match results.
+
+    Hands within a table are sequential because stacks carry across hands,
+    but the LLM waits of different tables overlap on the event loop. A shared
+    semaphore (MAX_CONCURRENT_HANDS) caps how many hands are in flight at
+    once so we don't blow past provider rate limits. Each finished match
+    appends one JSONL line to the results file for post-hoc analysis.
+    """
+
+    def __init__(self, tables: int = 1, hands: int = 20,
+                 results_path: str = "results/matches.jsonl"):
+        hand_limit = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_HANDS", "5")))
+        self.matches = [
+            GameOrchestrator(hands=hands, hand_limit=hand_limit)
+            for _ in range(tables)
+        ]
+        self.results_path = Path(results_path)
+
+    async def run(self):
+        """Run all matches concurrently and append their results as JSONL."""
+        results = await asyncio.gather(
+            *(match.run() for match in self.matches), return_exceptions=True
+        )
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.results_path, "ab") as fh:
+            for match_no, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    line = {"match": match_no, "error": repr(result)}
+                else:
+                    line = {"match": match_no, **(result or {})}
+                fh.write(fast_json.dumps(line, default=str) + b"\n")
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"Warning: a match failed: {result!r}")
+        return results
+
+
+async def run_tables(tables: int, hands: int):
+    """Run several independent tables concurrently (see TournamentRunner)."""
+    await TournamentRunner(tables=tables, hands=hands).run()
+
+
 async def main():
     """Main entry point."""
     print("=== Poker Game with Player Factory ===")
@@ -545,8 +839,21 @@ async def main():
     print(f"Initial stack: {GAME_CONFIG['initial_stack']}")
     print(f"Model commentary: {'ON' if SEE_MODEL_MONOLOGUE else 'OFF'}")
     
-    game = GameOrchestrator(hands=GAME_CONFIG['hands'])
-    await game.run()
+    tables = GAME_CONFIG.get("tables", 1)
+    # Open the OpenAI connection pool up front so the first decision of the
+    # run doesn't pay the cold TCP+TLS handshake
+    if any(config.get("provider") == "openai" for config in PLAYER_CONFIGS):
+        await prewarm_shared_openai_client()
+    try:
+        if tables > 1:
+            print(f"Tables: {tables}")
+            await run_tables(tables, GAME_CONFIG['hands'])
+        else:
+            game = GameOrchestrator(hands=GAME_CONFIG['hands'])
+            await game.run()
+    finally:
+        # Shut down the shared OpenAI connection pool once all tables finish
+        await close_shared_openai_client()
 
 if __name__ == "__main__":
     import warnings
@@ -10,6 +10,28 @@ class Player:
     For new code, consider using PlayerFactory directly.
     """
 
+    # Fixed attribute set: slots drop the per-instance __dict__ and turn
+    # every delegate lookup into an indexed slot fetch
+    __slots__ = (
+        '_player',
+        'name',
+        'provider',
+        'model',
+        'stack',
+        'initial_stack',
+        'hand_history',
+        'conversation_history',
+        'system_prompt',
+        'decision_times',
+        'position_stats',
+        'bluff_attempts',
+        'bluff_successes',
+        'value_bets',
+        'value_bet_successes',
+        'player_index',
+        'notes',
+    )
+
     def __init__(
         self,
         name: str,
@@ -17,14 +39,21 @@ class Player:
         model: str = None,
         initial_stack: int = 400,
         system_prompt: str = None,
+        http_client=None,
     ):
         # Create the actual player using the factory
+        # Only forward http_client when provided - most providers manage their
+        # own connections and don't accept the argument
+        extra_kwargs = {}
+        if http_client is not None:
+            extra_kwargs["http_client"] = http_client
         self._player = PlayerFactory.create_player(
             name=name,
             provider=provider,
             model=model,
             initial_stack=initial_stack,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            **extra_kwargs
         )
         
         # Expose all attributes and methods from the underlying player
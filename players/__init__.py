@@ -1,25 +1,32 @@
 """Poker players package for different LLM providers."""
 
-from .base_player import BasePlayer
-from .openai_player import OpenAIPlayer
-from .gemini_player import GeminiPlayer
-from .anthropic_player import AnthropicPlayer
-from .all_in_player import AllInPlayer
-from .grok_player import GrokPlayer
-from .callbox_player import CallboxPlayer
-from .gto_player import GTOPlayer
-from .cfr_gto_player import CFRGTOPlayer
-from .player_factory import PlayerFactory
+from importlib import import_module
 
-__all__ = [
-    "BasePlayer",
-    "OpenAIPlayer", 
-    "GeminiPlayer",
-    "AnthropicPlayer",
-    "AllInPlayer",
-    "GrokPlayer",
-    "CallboxPlayer",
-    "GTOPlayer",
-    "CFRGTOPlayer",
-    "PlayerFactory"
-] 
+# Provider modules are resolved lazily (PEP 562 module __getattr__): each one
+# imports its SDK (openai, google.genai, anthropic, ...) at module load, so
+# eager re-exports made every entry point pay the import cost of all providers
+# even when a run only uses one. `from players import OpenAIPlayer` still
+# works exactly as before.
+_LAZY_EXPORTS = {
+    "BasePlayer": "base_player",
+    "OpenAIPlayer": "openai_player",
+    "GeminiPlayer": "gemini_player",
+    "AnthropicPlayer": "anthropic_player",
+    "AllInPlayer": "all_in_player",
+    "GrokPlayer": "grok_player",
+    "CallboxPlayer": "callbox_player",
+    "GTOPlayer": "gto_player",
+    "CFRGTOPlayer": "cfr_gto_player",
+    "PlayerFactory": "player_factory",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so later lookups skip this hook
+    return value
@@ -9,6 +9,7 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+from utils import fast_json
 from utils.env_loader import get_env_value
 from .base_player import BasePlayer
 
@@ -16,6 +17,11 @@ from .base_player import BasePlayer
 class AnthropicPlayer(BasePlayer):
     """Anthropic-specific player implementation."""
 
+    PROVIDER = "anthropic"
+
+    # Anthropic counts the (larger) structured JSON replies against this cap
+    MAX_RESPONSE_TOKENS = 1000
+
     def __init__(
         self,
         name: str,
@@ -24,6 +30,7 @@ class AnthropicPlayer(BasePlayer):
         system_prompt: str = None,
         enable_reflection: bool = False,
         use_structured_output: bool = True,  # Default to True for Anthropic
+        http_client=None,
     ):
         super().__init__(
             name=name,
@@ -33,17 +40,26 @@ class AnthropicPlayer(BasePlayer):
             enable_reflection=enable_reflection,
             use_structured_output=use_structured_output,
         )
-        
+
         # Initialize Anthropic client
-        self._setup_anthropic_client()
+        self._setup_anthropic_client(http_client)
 
-    def _setup_anthropic_client(self):
-        """Setup Anthropic client with API key."""
+    def _setup_anthropic_client(self, http_client=None):
+        """Setup Anthropic client with API key.
+
+        Args:
+            http_client: Optional shared httpx.AsyncClient so multiple players
+                reuse one keep-alive connection pool instead of paying a fresh
+                TCP+TLS handshake per player.
+        """
         if not ANTHROPIC_AVAILABLE:
             raise ImportError("Anthropic provider requires the 'anthropic' package. Install with 'pip install anthropic'")
 
         anthropic_key = get_env_value("ANTHROPIC_KEY", required=True)
-        self.client = anthropic.AsyncAnthropic(api_key=anthropic_key)
+        if http_client is not None:
+            self.client = anthropic.AsyncAnthropic(api_key=anthropic_key, http_client=http_client)
+        else:
+            self.client = anthropic.AsyncAnthropic(api_key=anthropic_key)
 
     async def _chat(self, messages: Sequence[Dict[str, str]], structured_output: bool = False) -> str:
         """Send messages to Anthropic API and get response with optional structured output."""
@@ -54,20 +70,6 @@ class AnthropicPlayer(BasePlayer):
     
     async def _chat_structured(self, messages: Sequence[Dict[str, str]]) -> str:
         """Send messages to Anthropic API with structured output."""
-        from pydantic import BaseModel, Field
-        from typing import Literal, Optional
-        
-        class PokerAction(BaseModel):
-            action: Literal["fold", "check", "call", "raise_to", "show", "muck"] = Field(
-                description="The poker action to take. Must be one of: fold, check, call, raise_to, show, muck"
-            )
-            amount: Optional[int] = Field(
-                default=0,
-                description="Amount to raise to (only required for raise_to action, ignored otherwise)"
-            )
-            reason: str = Field(description="Your reasoning for this action")
-            notes: str = Field(default="", description="Optional notes to remember for future hands")
-
         # Convert from OpenAI-style messages to Anthropic format
         system_content = ""
         conversation = []
@@ -89,15 +91,14 @@ class AnthropicPlayer(BasePlayer):
             # Create the message request with structured output
             response = await self.client.messages.create(
                 model=self.model,
-                system=system_content,
+                system=self._cached_system_block(system_content),
                 messages=conversation,
-                max_tokens=1000,
+                max_tokens=self.MAX_RESPONSE_TOKENS,
                 response_format={"type": "json_object"}
             )
             
             # Parse the JSON response
-            import json
-            content = json.loads(response.content[0].text)
+            content = fast_json.loads(response.content[0].text)
             
         except Exception:
             print('Anthropic Structured output failed! Falling back to vanilla.')
@@ -153,9 +154,25 @@ class AnthropicPlayer(BasePlayer):
         # Create the message request
         response = await self.client.messages.create(
             model=self.model,
-            system=system_content,
+            system=self._cached_system_block(system_content),
             messages=conversation,
-            max_tokens=1000
+            max_tokens=self.MAX_RESPONSE_TOKENS
         )
-        
-        return response.content[0].text 
+
+        return response.content[0].text
+
+    @staticmethod
+    def _cached_system_block(system_content: str):
+        """Wrap the system prompt so Anthropic serves it from the prompt cache.
+
+        The system prompt is identical on every decision, so marking it with
+        `cache_control: ephemeral` lets repeated calls read it from the
+        server-side cache instead of reprocessing it each time.
+        """
+        return [
+            {
+                "type": "text",
+                "text": system_content,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
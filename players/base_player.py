@@ -2,15 +2,91 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import random
 import time
 from pathlib import Path
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Sequence, Optional
+
+from utils import fast_json
+from utils.rate_limiter import get_limiter
+
+# Default system prompts frozen as module-level constants. Providers cache
+# prompt prefixes on byte-identical leading tokens, so the system prompt must
+# be the exact same string on every call - never rebuilt per call or per
+# player - for automatic prompt caching to hit.
+_DEFAULT_SYSTEM_PROMPT = """You are a seasoned and experienced No limit Texas Holdem poker player, evaluating the current game state and making the decision
+        to fold, check, call, or raise to win as much money as possible. Do not fold when you are not facing a bet. Playing safe is not neccesarily the best strategy. Think about what
+        cards you have, which ones your opponents have, and what you could represent. Given this, then decide whether or not it is a good time to bluff. When you
+        have a bad hand, think about what you could represent to your opponents. If you have a good hand, think about how to extract the maxmium value from your opponents.
+        Response format:Output must be: <action>[optional integer]@<brief reason>. No other characters, no markdown. If you're raising, the optional integer range will be provided to you in the legal tokens. Explain your thinking but separate it from the token with a preceding '@' symbol
+        You will also be passed a a history of previous games with the actiona taken by previous players. Use this in your decision making.
+        You can maintain notes about your observations of the game. These notes will be shown to you in each decision to help you adapt your strategy over time. Add useful information about your opponent's tendencies, your own statistics, and reminders of effective strategies.
+        """
+
+_STRUCTURED_SYSTEM_PROMPT = """You are a seasoned and experienced No limit Texas Holdem poker player, evaluating the current game state and making the decision
+        to fold, check, call, or raise to win as much money as possible. Do not fold when you are not facing a bet. Playing safe is not neccesarily the best strategy. Think about what
+        cards you have, which ones your opponents have, and what you could represent. Given this, then decide whether or not it is a good time to bluff. When you
+        have a bad hand, think about what you could represent to your opponents. If you have a good hand, think about how to extract the maxmium value from your opponents.
+        You can maintain notes about your observations of the game. These notes will be shown to you in each decision to help you adapt your strategy over time. Add useful information about your opponent's tendencies, your own statistics, and reminders of effective strategies.
+        Output your action in the given structured format. Return an action from the ones provided, and the amount if raising, as well as your reasoning and notes if you want to take them.
+        You will also be passed a a history of previous games with the actiona taken by previous players. Use this in your decision making.
+
+       """
+
+
 class BasePlayer(ABC):
     """Abstract base class for all poker players."""
 
+    # Provider key for shared rate limiting; None (local bots) skips pacing
+    PROVIDER: Optional[str] = None
+
+    # Retry policy for transient provider failures
+    MAX_CHAT_RETRIES = 6
+
+    # Generation cap passed to the provider and reserved against the TPM
+    # budget alongside the prompt estimate
+    MAX_RESPONSE_TOKENS = 400
+
+    # Exception class names treated as transient across provider SDKs.
+    # Matching by name avoids importing every optional SDK here.
+    _TRANSIENT_ERROR_NAMES = frozenset({
+        "RateLimitError",
+        "APIConnectionError",
+        "APITimeoutError",
+        "InternalServerError",
+        "ServiceUnavailableError",
+        "OverloadedError",
+        "TimeoutError",
+        "ConnectError",
+        "ConnectTimeout",
+        "ReadTimeout",
+        "ReadError",
+    })
+
+    # Constant prompt fragments, built once at class level so per-decision
+    # prompt assembly only serializes the changing game state
+    DECISION_INSTRUCTIONS = (
+        "You can update your notes by including a line starting with 'NOTES:' "
+        "after your action and commentary."
+    )
+    SHOWDOWN_INSTRUCTIONS = (
+        "IMPORTANT: In poker, you can only win the pot if you show your cards. "
+        "If you muck, you forfeit any claim to the pot. Choose 'show' to reveal "
+        "your cards and potentially win, or 'muck' only if you are certain you "
+        "will not win. If you think you might have the best hand, you MUST show."
+    )
+    SHOWDOWN_CONSIDERATIONS = [
+        "CRITICAL: If you muck, you FORFEIT the pot - you cannot win if you muck",
+        "You MUST show your cards to claim the pot at showdown",
+        "Only muck if you are certain you will not win the pot",
+        "If you have a chance to win, you must show your cards",
+        "Showing reveals your playing style to opponents, but it's required to win",
+        "Mucking is forfeiting, not just hiding information",
+    ]
+
     def __init__(
         self,
         name: str,
@@ -30,6 +106,9 @@ class BasePlayer(ABC):
         self.conversation_history = []
         self.system_prompt = system_prompt or self._get_default_system_prompt()
         self.structured_system_prompt = self._get_structured_system_prompt()
+        # The system message never changes, so build it once instead of
+        # allocating a fresh dict on every ask() call
+        self._system_message = {"role": "system", "content": self.system_prompt}
         self.enable_reflection = enable_reflection
         self.use_structured_output = use_structured_output
         self.max_hand_history = max(1, max_hand_history)
@@ -57,26 +136,11 @@ class BasePlayer(ABC):
     
     def _get_structured_system_prompt(self) -> str:
         """Get the default system prompt for poker players."""
-        return """You are a seasoned and experienced No limit Texas Holdem poker player, evaluating the current game state and making the decision 
-        to fold, check, call, or raise to win as much money as possible. Do not fold when you are not facing a bet. Playing safe is not neccesarily the best strategy. Think about what 
-        cards you have, which ones your opponents have, and what you could represent. Given this, then decide whether or not it is a good time to bluff. When you 
-        have a bad hand, think about what you could represent to your opponents. If you have a good hand, think about how to extract the maxmium value from your opponents.        
-        You can maintain notes about your observations of the game. These notes will be shown to you in each decision to help you adapt your strategy over time. Add useful information about your opponent's tendencies, your own statistics, and reminders of effective strategies.
-        Output your action in the given structured format. Return an action from the ones provided, and the amount if raising, as well as your reasoning and notes if you want to take them.
-        You will also be passed a a history of previous games with the actiona taken by previous players. Use this in your decision making.
-
-       """
+        return _STRUCTURED_SYSTEM_PROMPT
 
     def _get_default_system_prompt(self) -> str:
         """Get the default system prompt for poker players."""
-        return """You are a seasoned and experienced No limit Texas Holdem poker player, evaluating the current game state and making the decision 
-        to fold, check, call, or raise to win as much money as possible. Do not fold when you are not facing a bet. Playing safe is not neccesarily the best strategy. Think about what 
-        cards you have, which ones your opponents have, and what you could represent. Given this, then decide whether or not it is a good time to bluff. When you 
-        have a bad hand, think about what you could represent to your opponents. If you have a good hand, think about how to extract the maxmium value from your opponents.        
-        Response format:Output must be: <action>[optional integer]@<brief reason>. No other characters, no markdown. If you're raising, the optional integer range will be provided to you in the legal tokens. Explain your thinking but separate it from the token with a preceding '@' symbol
-        You will also be passed a a history of previous games with the actiona taken by previous players. Use this in your decision making.
-        You can maintain notes about your observations of the game. These notes will be shown to you in each decision to help you adapt your strategy over time. Add useful information about your opponent's tendencies, your own statistics, and reminders of effective strategies.
-        """
+        return _DEFAULT_SYSTEM_PROMPT
 
 
     @abstractmethod
@@ -84,12 +148,51 @@ class BasePlayer(ABC):
         """Send messages to the LLM provider and get response."""
         pass
 
+    @classmethod
+    def _is_transient_error(cls, exc: Exception) -> bool:
+        """Whether an exception looks like a retryable provider hiccup."""
+        return any(
+            klass.__name__ in cls._TRANSIENT_ERROR_NAMES
+            for klass in type(exc).__mro__
+        )
+
+    @staticmethod
+    def _retry_after_seconds(exc: Exception) -> float:
+        """Extract a Retry-After hint from a provider error, or 0."""
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers:
+            try:
+                return float(headers.get("retry-after", 0))
+            except (TypeError, ValueError):
+                pass
+        return 0.0
+
+    async def _chat_with_retry(self, messages: Sequence[Dict[str, str]]) -> str:
+        """Call _chat with exponential backoff + jitter on transient errors.
+
+        Without this, a single network hiccup propagates into the betting
+        loop and turns into a forced fold.
+        """
+        for attempt in range(self.MAX_CHAT_RETRIES):
+            try:
+                return await self._chat(messages)
+            except Exception as e:
+                if attempt == self.MAX_CHAT_RETRIES - 1 or not self._is_transient_error(e):
+                    raise
+                delay = min(60, 2 ** attempt) + random.random()
+                # Rate-limit errors may carry an explicit Retry-After hint
+                delay = max(delay, self._retry_after_seconds(e))
+                print(f"{self.name}: transient LLM error ({type(e).__name__}), "
+                      f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.MAX_CHAT_RETRIES})")
+                await asyncio.sleep(delay)
+
     
 
     async def ask(self, messages: Sequence[Dict[str, str]]) -> str:
         """Route request to appropriate LLM provider with intelligent memory management."""
-        # Start with system prompt
-        full_messages = [{"role": "system", "content": self.system_prompt}]
+        # Start with system prompt (prebuilt once in __init__)
+        full_messages = [self._system_message]
 
         # Add summarized memory from previous hands
         if self.hand_history:
@@ -103,13 +206,18 @@ class BasePlayer(ABC):
         # Add current hand conversation history (detailed)
         current_hand_messages = self._get_current_hand_messages()
         full_messages.extend(current_hand_messages)
-        
+
         # Add the current message if it's not already in conversation history
-        if messages and messages[-1]["role"] == "user" and (not self.conversation_history or 
+        if messages and messages[-1]["role"] == "user" and (not self.conversation_history or
                                                           messages[-1] != self.conversation_history[-1]):
             full_messages.append(messages[-1])
-        
-        response = await self._chat(full_messages)
+
+        # Pace the request against the provider's shared RPM/TPM budget so
+        # concurrent tables don't burst into 429s
+        if self.PROVIDER is not None:
+            await get_limiter(self.PROVIDER).acquire(full_messages, self.MAX_RESPONSE_TOKENS)
+
+        response = await self._chat_with_retry(full_messages)
         
         # Update conversation history with user's message and AI's response
         if messages and messages[-1]["role"] == "user" and (not self.conversation_history or 
@@ -127,13 +235,12 @@ class BasePlayer(ABC):
         game_state["notes"] = self.notes
         game_state["can_update_notes"] = True
         
-        prompt_json = json.dumps(
+        prompt_json = fast_json.dumps_str(
             {
                 "state": game_state,
                 "legal": legal_actions,
-                "instructions": "You can update your notes by including a line starting with 'NOTES:' after your action and commentary.",
-            },
-            separators=(',', ':'),
+                "instructions": self.DECISION_INSTRUCTIONS,
+            }
         )
         
         # Only send the user message since system prompt and history are handled in ask()
@@ -184,24 +291,16 @@ class BasePlayer(ABC):
             "situation": "showdown",
             "decision_type": "show_or_muck",
             "context": "Decide whether to reveal your hole cards or muck them face-down",
-            "considerations": [
-                "CRITICAL: If you muck, you FORFEIT the pot - you cannot win if you muck",
-                "You MUST show your cards to claim the pot at showdown",
-                "Only muck if you are certain you will not win the pot",
-                "If you have a chance to win, you must show your cards",
-                "Showing reveals your playing style to opponents, but it's required to win",
-                "Mucking is forfeiting, not just hiding information"
-            ],
+            "considerations": self.SHOWDOWN_CONSIDERATIONS,
             "notes": self.notes
         }
-        
-        prompt_json = json.dumps(
+
+        prompt_json = fast_json.dumps_str(
             {
                 "state": showdown_context,
                 "legal": legal_actions,
-                "instructions": "IMPORTANT: In poker, you can only win the pot if you show your cards. If you muck, you forfeit any claim to the pot. Choose 'show' to reveal your cards and potentially win, or 'muck' only if you are certain you will not win. If you think you might have the best hand, you MUST show.",
-            },
-            separators=(',', ':'),
+                "instructions": self.SHOWDOWN_INSTRUCTIONS,
+            }
         )
         
         messages = [
@@ -251,7 +350,7 @@ class BasePlayer(ABC):
             "output_format": "Provide 2-3 key insights and any strategic adjustments you want to make. Be concise but specific."
         }
         
-        prompt_json = json.dumps(reflection_prompt, separators=(',', ':'))
+        prompt_json = fast_json.dumps_str(reflection_prompt)
         messages = [{"role": "user", "content": prompt_json}]
         
         try:
@@ -306,13 +405,18 @@ class BasePlayer(ABC):
             cards_str = ', '.join(str(card) for card in my_hole_cards)
             summary += f"Dealt {cards_str}. "
         
-        # Convert PokerKit operations to human-readable actions
+        # Convert PokerKit operations to human-readable actions, reusing the
+        # lines cached by update_memory when the hand has already been rendered
         if 'pokerkit_operations' in hand_result:
+            rendered = hand_result.get('rendered_actions')
+            if rendered is None:
+                rendered = ActionConverter.to_human_readable_many(
+                    hand_result['pokerkit_operations'], player_names
+                )
             actions = []
             board_cards_dealt = 0  # Track how many board cards have been dealt
-            
-            for op in hand_result['pokerkit_operations']:
-                readable = ActionConverter.to_human_readable(op, player_names)
+
+            for readable in rendered:
                 if readable and readable.strip():  # Only include non-empty actions
                     
                     # Skip redundant hole card dealing messages
@@ -389,7 +493,17 @@ class BasePlayer(ABC):
         
         # Set current hand ID for memory management
         self.current_hand_id = hand_result.get('hand_id')
-        
+
+        # Render the raw operations once and keep the lines with the hand,
+        # so the summary below and any later prompt building read the cached
+        # strings instead of re-running the converter
+        if 'pokerkit_operations' in hand_result and 'rendered_actions' not in hand_result:
+            from utils.action_converter import ActionConverter
+            hand_result['rendered_actions'] = ActionConverter.to_human_readable_many(
+                hand_result['pokerkit_operations'],
+                hand_result.get('player_names', []),
+            )
+
         # Create human-readable hand summary using ActionConverter
         summary = self._create_human_readable_hand_summary(hand_result)
         
@@ -39,16 +39,16 @@ class CallboxPlayer(BasePlayer):
 
     def _extract_game_state(self, messages: Sequence[Dict[str, str]]) -> Dict[str, Any]:
         """Extract game state from the messages."""
-        import json
-        
+        from utils import fast_json
+
         # Find the last user message which contains the game state
         for msg in reversed(messages):
             if msg["role"] == "user":
                 try:
                     # Parse the JSON content
-                    content = json.loads(msg["content"])
+                    content = fast_json.loads(msg["content"])
                     return content.get("state", {})
-                except (json.JSONDecodeError, KeyError):
+                except (ValueError, KeyError):
                     continue
         
         # Fallback to empty dict if we can't parse
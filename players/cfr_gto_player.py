@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import os
 import random
 import re
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from utils import fast_json
+
 from .base_player import BasePlayer
 
 
@@ -161,8 +162,8 @@ class CFRGTOPlayer(BasePlayer):
             if msg.get("role") != "user":
                 continue
             try:
-                payload = json.loads(msg.get("content", "{}"))
-            except json.JSONDecodeError:
+                payload = fast_json.loads(msg.get("content", "{}"))
+            except ValueError:
                 continue
             return payload.get("state", {}), payload.get("legal", [])
         return {}, []
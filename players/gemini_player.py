@@ -1,7 +1,8 @@
 """Gemini player implementation for Poker RL agents."""
 
-from typing import Sequence, Dict
-from pydantic import BaseModel
+import asyncio
+from typing import Literal, Optional, Sequence, Dict
+from pydantic import BaseModel, Field
 
 # Handle optional imports
 try:
@@ -13,10 +14,41 @@ except ImportError:
 from utils.env_loader import get_env_value
 from .base_player import BasePlayer
 
+# Process-wide Gemini client, created lazily on first use. The client owns
+# the underlying HTTP session, so sharing it across players reuses one
+# connection pool instead of rebuilding sessions per player.
+_SHARED_CLIENT = None
+
+
+def _shared_gemini_client():
+    """Return the lazily-created shared Gemini client."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        gemini_key = get_env_value("GEMINI_KEY", required=True)
+        _SHARED_CLIENT = genai.Client(api_key=gemini_key)
+    return _SHARED_CLIENT
+
+
+class PokerAction(BaseModel):
+    """Structured decision schema, built once at module level so each call
+    reuses the same response schema object."""
+
+    action: Literal["fold", "check", "call", "raise_to", "show", "muck"] = Field(
+        description="The poker action to take. Must be one of: fold, check, call, raise_to, show, muck"
+    )
+    amount: Optional[int] = Field(
+        default=0,
+        description="Amount to raise to (only required for raise_to action, ignored otherwise)"
+    )
+    reason: str = Field(description="Your reasoning for this action")
+    notes: str = Field(default="", description="Optional notes to remember for future hands")
+
 
 class GeminiPlayer(BasePlayer):
     """Gemini-specific player implementation."""
 
+    PROVIDER = "gemini"
+
     def __init__(
         self,
         name: str,
@@ -43,8 +75,7 @@ class GeminiPlayer(BasePlayer):
         if not GEMINI_AVAILABLE:
             raise ImportError("Gemini provider requires the 'google-genai' package. Install with 'pip install google-genai'")
 
-        gemini_key = get_env_value("GEMINI_KEY", required=True)
-        self.client = genai.Client(api_key = gemini_key)
+        self.client = _shared_gemini_client()
 
     async def _chat(self, messages: Sequence[Dict[str, str]], structured_output: bool = False) -> str:
         """Send messages to Gemini API and get response with optional structured output."""
@@ -55,20 +86,6 @@ class GeminiPlayer(BasePlayer):
     
     async def _chat_structured(self, messages: Sequence[Dict[str, str]]) -> str:
         """Send messages to Gemini API with structured output."""
-        from typing import Literal, Optional
-        from pydantic import Field
-        
-        class PokerAction(BaseModel):
-            action: Literal["fold", "check", "call", "raise_to", "show", "muck"] = Field(
-                description="The poker action to take. Must be one of: fold, check, call, raise_to, show, muck"
-            )
-            amount: Optional[int] = Field(
-                default=0,
-                description="Amount to raise to (only required for raise_to action, ignored otherwise)"
-            )
-            reason: str = Field(description="Your reasoning for this action")
-            notes: str = Field(default="", description="Optional notes to remember for future hands")
-
         # Build the full conversation history for context
         full_history = ""
         for msg in messages:
@@ -79,8 +96,11 @@ class GeminiPlayer(BasePlayer):
             elif msg["role"] == "assistant":
                 full_history += f"<assistant>\n{msg['content']}\n</assistant>\n"
         try:
-            rsp = self.client.models.generate_content(
-                model=self.model, 
+            # generate_content is synchronous; run it off the event loop so a
+            # slow Gemini call doesn't stall every other player's turn
+            rsp = await asyncio.to_thread(
+                self.client.models.generate_content,
+                model=self.model,
                 contents=full_history,
                 config={
                     "response_mime_type": "application/json",
@@ -132,11 +152,12 @@ class GeminiPlayer(BasePlayer):
             elif msg["role"] == "assistant":
                 full_history += f"<assistant>\n{msg['content']}\n</assistant>\n"
         
-        rsp = self.client.models.generate_content(
-            model=self.model, 
+        rsp = await asyncio.to_thread(
+            self.client.models.generate_content,
+            model=self.model,
             contents=full_history
         )
-        
+
         return rsp.text.strip()
 
 if __name__ == "__main__":
@@ -17,6 +17,8 @@ from .base_player import BasePlayer
 class GrokPlayer(BasePlayer):
     """xAI Grok-specific player implementation using OpenAI-compatible API."""
 
+    PROVIDER = "grok"
+
     def __init__(
         self,
         name: str,
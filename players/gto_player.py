@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import re
 from collections import Counter
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from utils import fast_json
+
 from .base_player import BasePlayer
 
 
@@ -56,8 +57,8 @@ class GTOPlayer(BasePlayer):
             if msg.get("role") != "user":
                 continue
             try:
-                payload = json.loads(msg.get("content", "{}"))
-            except json.JSONDecodeError:
+                payload = fast_json.loads(msg.get("content", "{}"))
+            except ValueError:
                 continue
             return payload.get("state", {}), payload.get("legal", [])
         return {}, []
@@ -1,8 +1,11 @@
 """OpenAI player implementation for Poker RL agents."""
 
+import re
 from typing import Sequence, Dict, Literal, Optional
 from pydantic import BaseModel, Field
 
+import httpx
+
 # Handle optional imports
 try:
     import openai
@@ -10,13 +13,117 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# HTTP/2 lets many concurrent calls multiplex over one connection; httpx
+# only enables it when the 'h2' extra is installed (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from utils.env_loader import get_env_value
 from .base_player import BasePlayer
 
+# Process-wide AsyncOpenAI client, created lazily on first use. Every OpenAI
+# player shares it so all calls reuse one keep-alive connection pool instead
+# of each player re-doing TLS handshakes on its own cold sockets.
+_SHARED_CLIENT = None
+
+
+def _shared_openai_client():
+    """Return the lazily-created shared AsyncOpenAI client."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        _SHARED_CLIENT = openai.AsyncOpenAI(
+            api_key=get_env_value("OPENAI_KEY", required=True),
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            ),
+        )
+    return _SHARED_CLIENT
+
+
+async def prewarm_shared_openai_client():
+    """Open the shared pool's connection before the first real decision.
+
+    A cold TCP+TLS handshake adds hundreds of ms to the first API call of a
+    run; one cheap throwaway request at startup moves that cost out of the
+    first hand. Best-effort: failures are ignored and real calls just open
+    connections lazily as before.
+    """
+    try:
+        await _shared_openai_client().models.list()
+    except Exception:
+        pass
+
+
+class PokerAction(BaseModel):
+    """Structured decision schema.
+
+    Defined at module level so the derived JSON schema is built once and is
+    byte-identical on every request, which also keeps the request prefix
+    stable for server-side prompt caching.
+    """
+
+    action: Literal["fold", "check", "call", "raise_to", "show", "muck"] = Field(
+        description="The poker action to take. Must be one of: fold, check, call, raise_to, show, muck"
+    )
+    amount: Optional[int] = Field(
+        default=0,
+        description="Amount to raise to (only required for raise_to action, ignored otherwise)"
+    )
+    reason: str = Field(description="Your reasoning for this action")
+    notes: str = Field(default="", description="Optional notes to remember for future hands")
+
+
+# A complete first line of a vanilla reply: action token, optionally
+# '@commentary'. Once this has streamed in, the rest of the reply is only
+# worth reading if it carries a NOTES/PLAN continuation.
+_ACTION_LINE_RE = re.compile(
+    r"(?:fold|check|call|show|muck|raise_to\s*[: ]\s*\d+)\s*(?:@.*)?$",
+    re.IGNORECASE,
+)
+
+# Follow-up lines the parser actually consumes; anything else after the
+# action line is free-form prose we can skip paying for
+_KEEP_PREFIXES = ("NOTES:", "PLAN:")
+
+
+def _stream_can_stop(text: str) -> bool:
+    """Decide whether a partially streamed reply already has all we need."""
+    newline = text.find("\n")
+    if newline == -1:
+        return False
+    if not _ACTION_LINE_RE.match(text[:newline].strip()):
+        # Malformed first line - read everything so the fallback parser and
+        # logs see the full response
+        return False
+    rest = text[newline + 1:].lstrip()
+    if not rest:
+        # Can't tell yet whether a NOTES/PLAN line follows
+        return False
+    # Keep reading while the continuation is (or could still become) a
+    # NOTES/PLAN line the parser uses
+    return not any(
+        rest.startswith(p) or p.startswith(rest[: len(p)]) for p in _KEEP_PREFIXES
+    )
+
+
+async def close_shared_openai_client():
+    """Close the shared client's connection pool at process shutdown."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.close()
+        _SHARED_CLIENT = None
+
 
 class OpenAIPlayer(BasePlayer):
     """OpenAI-specific player implementation."""
 
+    PROVIDER = "openai"
+
     def __init__(
         self,
         name: str,
@@ -25,6 +132,7 @@ class OpenAIPlayer(BasePlayer):
         system_prompt: str = None,
         enable_reflection: bool = False,
         use_structured_output: bool = True,
+        http_client=None,
     ):
         super().__init__(
             name=name,
@@ -34,33 +142,30 @@ class OpenAIPlayer(BasePlayer):
             enable_reflection=enable_reflection,
             use_structured_output=use_structured_output,
         )
-        
+
         # Initialize OpenAI client
-        self._setup_openai_client()
+        self._setup_openai_client(http_client)
 
-    def _setup_openai_client(self):
-        """Setup OpenAI client with API key."""
+    def _setup_openai_client(self, http_client=None):
+        """Setup OpenAI client with API key.
+
+        Args:
+            http_client: Optional shared httpx.AsyncClient so multiple players
+                reuse one keep-alive connection pool instead of paying a fresh
+                TCP+TLS handshake per player.
+        """
         if not OPENAI_AVAILABLE:
             raise ImportError("OpenAI provider requires the 'openai' package. Install with 'pip install openai'")
 
-        openai_key = get_env_value("OPENAI_KEY", required=True)
-        self.client = openai.AsyncOpenAI(api_key=openai_key)
+        if http_client is not None:
+            openai_key = get_env_value("OPENAI_KEY", required=True)
+            self.client = openai.AsyncOpenAI(api_key=openai_key, http_client=http_client)
+        else:
+            self.client = _shared_openai_client()
 
     async def _chat(self, messages: Sequence[Dict[str, str]]) -> str:
         """Send messages to OpenAI API and get response with structured output when possible."""
         # Prefer structured output to reduce parsing errors
-        # Use Literal to constrain action to only valid values
-        class PokerAction(BaseModel):
-            action: Literal["fold", "check", "call", "raise_to", "show", "muck"] = Field(
-                description="The poker action to take. Must be one of: fold, check, call, raise_to, show, muck"
-            )
-            amount: Optional[int] = Field(
-                default=0,
-                description="Amount to raise to (only required for raise_to action, ignored otherwise)"
-            )
-            reason: str = Field(description="Your reasoning for this action")
-            notes: str = Field(default="", description="Optional notes to remember for future hands")
-
         try:
             rsp = await self.client.responses.parse(
                 model = self.model,
@@ -73,13 +178,7 @@ class OpenAIPlayer(BasePlayer):
         except Exception:
             print('Openai Structured output failed!')
             # Fallback: no structured output
-            rsp = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=400,
-            )
-            return rsp.choices[0].message.content.strip()
+            return await self._chat_vanilla(messages)
 
         # Try to convert structured JSON into required string format
         try:
@@ -113,3 +212,42 @@ class OpenAIPlayer(BasePlayer):
             # If JSON parsing fails, return raw content
             print(f'Exception in structured output conversion: {e}')
             return content.strip() if isinstance(content, str) else str(content)
+
+    async def _chat_vanilla(self, messages: Sequence[Dict[str, str]]) -> str:
+        """Stream the vanilla completion, closing early once we have enough.
+
+        The model happily pads replies with several sentences of prose after
+        the action line; streaming lets us stop reading (and paying for output
+        tokens) as soon as the action line plus any NOTES/PLAN continuation
+        has arrived. Any streaming failure falls back to one full read.
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=self.MAX_RESPONSE_TOKENS,
+                stream=True,
+            )
+            parts = []
+            saw_newline = False
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                # Nothing can be decided before the action line is complete,
+                # so skip the accumulated-text scan until a newline arrives
+                saw_newline = saw_newline or "\n" in delta
+                if saw_newline and _stream_can_stop("".join(parts)):
+                    await stream.close()
+                    break
+            return "".join(parts).strip()
+        except Exception:
+            rsp = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=self.MAX_RESPONSE_TOKENS,
+            )
+            return rsp.choices[0].message.content.strip()
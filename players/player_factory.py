@@ -1,15 +1,13 @@
 """Player factory for creating poker players with different LLM providers."""
 
-from typing import Optional, Dict, List
+import functools
+from typing import Optional, Dict, List, Tuple
+
+# Provider modules are imported lazily inside create_player: each one drags
+# in its SDK (openai, google.genai, anthropic, ...) at import time, and a run
+# typically uses one or two providers, so importing all of them up front just
+# slows startup for every entry point that touches the factory.
 
-from .openai_player import OpenAIPlayer
-from .gemini_player import GeminiPlayer
-from .anthropic_player import AnthropicPlayer
-from .all_in_player import AllInPlayer
-from .grok_player import GrokPlayer
-from .callbox_player import CallboxPlayer
-from .gto_player import GTOPlayer
-from .cfr_gto_player import CFRGTOPlayer
 
 class PlayerFactory:
     """Factory class for creating poker players with different LLM providers."""
@@ -27,14 +25,14 @@ class PlayerFactory:
     }
     
     @classmethod
-    def get_supported_providers(cls) -> List[str]:
-        """Get list of supported providers."""
-        return list(cls.SUPPORTED_MODELS.keys())
-    
+    def get_supported_providers(cls) -> Tuple[str, ...]:
+        """Get the supported providers."""
+        return _supported_providers()
+
     @classmethod
-    def get_supported_models(cls, provider: str) -> List[str]:
-        """Get list of supported models for a specific provider."""
-        return cls.SUPPORTED_MODELS.get(provider, [])
+    def get_supported_models(cls, provider: str) -> Tuple[str, ...]:
+        """Get the supported models for a specific provider."""
+        return _supported_models(provider)
     
     @classmethod
     def create_player(
@@ -77,22 +75,31 @@ class PlayerFactory:
                 raise ValueError(f"No default model configured for provider '{provider}'. Please specify a model.")
             model = defaults[0]  # First model as default
         
-        # Create appropriate player
+        # Create appropriate player (provider SDKs are only imported for the
+        # providers actually in play)
         if provider == "openai":
+            from .openai_player import OpenAIPlayer
             return OpenAIPlayer(name, model, enable_reflection=enable_reflection, use_structured_output=use_structured_output, **kwargs)
         elif provider == "gemini":
+            from .gemini_player import GeminiPlayer
             return GeminiPlayer(name, model, enable_reflection=enable_reflection, use_structured_output=use_structured_output, **kwargs)
         elif provider == "anthropic":
+            from .anthropic_player import AnthropicPlayer
             return AnthropicPlayer(name, model, enable_reflection=enable_reflection, use_structured_output=use_structured_output, **kwargs)
         elif provider == "all-in":
+            from .all_in_player import AllInPlayer
             return AllInPlayer(name, model, enable_reflection=enable_reflection, use_structured_output=use_structured_output, **kwargs)
         elif provider == "grok":
+            from .grok_player import GrokPlayer
             return GrokPlayer(name, model, enable_reflection=enable_reflection, use_structured_output=use_structured_output, **kwargs)
         elif provider == "callbox":
+            from .callbox_player import CallboxPlayer
             return CallboxPlayer(name, model, enable_reflection=enable_reflection, use_structured_output=use_structured_output, **kwargs)
         elif provider == "gto":
+            from .gto_player import GTOPlayer
             return GTOPlayer(name, model, enable_reflection=enable_reflection, **kwargs)
         elif provider == "cfr-gto":
+            from .cfr_gto_player import CFRGTOPlayer
             return CFRGTOPlayer(name, model, enable_reflection=enable_reflection, **kwargs)
         else:
             # This should never happen due to validation above
@@ -122,4 +129,17 @@ class PlayerFactory:
     def create_gto_player(cls, name: str, model: str = "gto-bot", **kwargs):
         """Convenience method to create the deterministic GTO baseline player."""
         return cls.create_player(name, "gto", model, **kwargs)
+
+
+# The registry never changes at runtime, so the listings are computed once
+# and the shared tuples handed back to every caller (lru_cache composes
+# awkwardly with classmethods, hence the module-level helpers)
+@functools.lru_cache(maxsize=None)
+def _supported_providers() -> Tuple[str, ...]:
+    return tuple(PlayerFactory.SUPPORTED_MODELS)
+
+
+@functools.lru_cache(maxsize=None)
+def _supported_models(provider: str) -> Tuple[str, ...]:
+    return tuple(PlayerFactory.SUPPORTED_MODELS.get(provider, ()))
     
@@ -4,6 +4,17 @@ import asyncio
 from player import Player
 from players.player_factory import PlayerFactory
 
+_INITIAL_STACKS = (400, 400)
+
+# Every hand record has the same shape; copy this prototype per hand and
+# fill in the per-hand fields instead of rebuilding the dict from a literal
+_HAND_TEMPLATE = {
+    "hand_id": 0,
+    "starting_stacks": None,
+    "actions": None,
+    "result": None,
+}
+
 
 async def example_all_in_game():
     """Example of using All-In player in a real game scenario."""
@@ -44,10 +55,10 @@ async def example_all_in_game():
     for i, hand in enumerate(hands, 1):
         print(f"Hand {i}: {hand['name']}")
         
-        # Check if game should continue
-        active_players = [p for p in [all_in_player, regular_player] if p.stack > 0]
-        if len(active_players) < 2:
-            eliminated_players = [p.name for p in [all_in_player, regular_player] if p.stack == 0]
+        # Check if game should continue - plain boolean tests, so the common
+        # (both alive) path allocates nothing
+        if all_in_player.stack <= 0 or regular_player.stack <= 0:
+            eliminated_players = [p.name for p in (all_in_player, regular_player) if p.stack == 0]
             print(f"  Game ended early: Players eliminated: {eliminated_players}")
             print(f"  Remaining hands skipped: {5 - i}")
             break
@@ -60,18 +71,26 @@ async def example_all_in_game():
             all_in_player.stack = hand['result']['final_stacks'][0]
             regular_player.stack = hand['result']['final_stacks'][1]
         
-        # Update hand data
-        hand_data = {
-            "hand_id": i,
-            "starting_stacks": [400, 400] if i == 1 else [all_in_player.stack, regular_player.stack],
-            "actions": [{"player": 0, "action": hand['all_in_action'].split('@')[0], "commentary": hand['all_in_action'].split('@')[1]}],
-            "result": hand['result']
-        }
+        # Update hand data (split the action@commentary string once)
+        action_name, _, commentary = hand['all_in_action'].partition('@')
+        hand_data = _HAND_TEMPLATE.copy()
+        hand_data['hand_id'] = i
+        hand_data['starting_stacks'] = (
+            _INITIAL_STACKS if i == 1 else (all_in_player.stack, regular_player.stack)
+        )
+        hand_data['actions'] = (
+            {"player": 0, "action": action_name, "commentary": commentary},
+        )
+        hand_data['result'] = hand['result']
         
         all_in_player.player_index = 0
         regular_player.player_index = 1
-        all_in_player.update_memory(hand_data)
-        regular_player.update_memory(hand_data)
+        # update_memory is async (it may reflect via the LLM); run both
+        # players' updates concurrently instead of back-to-back
+        await asyncio.gather(
+            all_in_player.update_memory(hand_data),
+            regular_player.update_memory(hand_data),
+        )
         
         print(f"  Result: {all_in_player.name}={all_in_player.stack}, {regular_player.name}={regular_player.stack}")
         print()
@@ -79,15 +79,19 @@ async def example_all_in_game():
         }
     ]
     
-    for i, scenario in enumerate(test_scenarios, 1):
+    # Each scenario decision is an independent async call, so issue them all
+    # concurrently and print once the batch resolves
+    decisions = await asyncio.gather(
+        *(all_in_player.make_decision(s['game_state'], s['legal_actions'])
+          for s in test_scenarios)
+    )
+
+    for i, (scenario, decision) in enumerate(zip(test_scenarios, decisions), 1):
         print(f"Scenario {i}: {scenario['name']}")
         print(f"  Game State: Stack={scenario['game_state']['Your stack']}, "
               f"Min Raise={scenario['game_state']['min_raise_to']}, "
               f"To Call={scenario['game_state']['to_call']}")
         print(f"  Legal Actions: {scenario['legal_actions']}")
-        
-        # Get decision from All-In player
-        decision = await all_in_player.make_decision(scenario['game_state'], scenario['legal_actions'])
         print(f"  All-In Decision: {decision}")
         print()
     
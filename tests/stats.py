@@ -0,0 +1,76 @@
+"""Offline stats over the append-only hand journal written by test.py.
+
+Streams a hands.jsonl file one line at a time (so arbitrarily long runs fit
+in constant memory) and reports per-player VPIP, PFR, wins and profit. Doing
+this offline keeps the live orchestrator loop free of aggregation work and
+lets a crashed or in-progress run be analyzed at any point.
+"""
+
+import argparse
+
+from utils import fast_json
+
+
+def iter_hands(path):
+    """Yield one decoded hand dict per journal line, skipping blanks."""
+    with open(path, "rb") as fh:
+        for line in fh:
+            if line.strip():
+                yield fast_json.loads(line)
+
+
+def compute_stats(hands, num_players: int = 2):
+    """Aggregate per-player stats from an iterable of journaled hands."""
+    stats = [
+        {"hands": 0, "vpip": 0, "pfr": 0, "wins": 0, "profit": 0}
+        for _ in range(num_players)
+    ]
+    for hand in hands:
+        dealer = hand["dealer_position"]
+        voluntary = [False] * num_players
+        raised = [False] * num_players
+        # VPIP/PFR are preflop stats; the journal records the boundary so no
+        # scanning for board-dealing markers is needed
+        actions = hand["actions"]
+        preflop_end = hand.get("preflop_end")
+        if preflop_end is not None:
+            actions = actions[:preflop_end]
+        for action in actions:
+            act = action["action"]
+            idx = action["player"]
+            if act == "call" or act.startswith("raise_to"):
+                voluntary[idx] = True
+            if act.startswith("raise_to"):
+                raised[idx] = True
+        for idx in range(num_players):
+            s = stats[idx]
+            s["hands"] += 1
+            s["vpip"] += voluntary[idx]
+            s["pfr"] += raised[idx]
+            # Profits are keyed by position; map this player back to the
+            # position they held given the hand's dealer button
+            position = (idx - dealer) % num_players
+            profit = hand["result"].get(f"profit_p{position}", 0)
+            s["profit"] += profit
+            s["wins"] += profit > 0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a poker hand journal")
+    parser.add_argument("path", nargs="?", default="hands.jsonl",
+                        help="hand journal to read (default: hands.jsonl)")
+    args = parser.parse_args()
+
+    stats = compute_stats(iter_hands(args.path))
+    for idx, s in enumerate(stats):
+        hands = s["hands"]
+        vpip_pct = s["vpip"] / hands * 100 if hands else 0
+        pfr_pct = s["pfr"] / hands * 100 if hands else 0
+        print(f"Player {idx}: {s['wins']}/{hands} hands won, Total profit: {s['profit']}")
+        print(f"  VPIP: {vpip_pct:.1f}% ({s['vpip']}/{hands} hands)")
+        print(f"  PFR: {pfr_pct:.1f}% ({s['pfr']}/{hands} hands)")
+
+
+if __name__ == "__main__":
+    main()
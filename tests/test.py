@@ -19,20 +19,30 @@ core loop behaves.
 """
 from __future__ import annotations
 
+import array
 import asyncio
-import json
+import collections
+import copy
+import hashlib
+import os
+import pickle
 import random
-import re
+import sys
+import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Sequence
 from pathlib import Path
 
+import httpx
+import numpy as np
+
 # Remove dotenv loading since Player handles API keys internally
-from pokerkit.state import HoleCardsShowingOrMucking, BetCollection, BlindOrStraddlePosting, CardBurning, HoleDealing, ChipsPulling
+from pokerkit.state import HoleCardsShowingOrMucking, BetCollection, BlindOrStraddlePosting, BoardDealing, CardBurning, HoleDealing, ChipsPulling
 
-from pokerkit import Automation, Mode, NoLimitTexasHoldem
+from pokerkit import Automation, Card, Mode, NoLimitTexasHoldem
 
 from player import Player  # Import the new Player class
+from utils import fast_json
 from utils.env_loader import get_env_value
 
 ############################################################
@@ -56,7 +66,128 @@ RAISE_SIZES = (
 )  # pot‑ish raise slot
 
 RNG_SEED = 42
-LEGAL_TOKEN_RE = re.compile(r"^(fold|check|call|raise_to:\s*\d+)$")
+
+
+def _valid_token(rsp: str) -> bool:
+    """Validate a response token without the regex engine.
+
+    The grammar is tiny (fold | check | call | raise_to:<int>), so a couple of
+    string checks beat running `re.match` on every decision in the betting loop.
+    """
+    if rsp in ("fold", "check", "call"):
+        return True
+    if rsp.startswith("raise_to:"):
+        return rsp[9:].strip().isdigit()
+    return False
+
+
+def _make_http_client() -> httpx.AsyncClient:
+    """Build a keep-alive pooled HTTP client for a provider.
+
+    HTTP/2 multiplexing is enabled when the optional `h2` package is
+    installed; otherwise HTTP/1.1 keep-alive still amortizes the TCP+TLS
+    handshake across calls.
+    """
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+
+# Integer encoding for logged actions (see HandLog.action_kinds)
+ACTION_FOLD, ACTION_CHECK, ACTION_CALL, ACTION_RAISE = 0, 1, 2, 3
+_ACTION_KIND = {"fold": ACTION_FOLD, "check": ACTION_CHECK, "call": ACTION_CALL}
+
+
+class HandLog:
+    """Columnar (structure-of-arrays) record of one completed hand.
+
+    Parallel integer arrays replace the nested list-of-dicts layout for the
+    stats sweep: per-hand memory drops from hundreds of bytes of dict
+    overhead per action to a few machine words, and the NumPy aggregation
+    pass reads the columns directly with no per-row dict lookups.
+    """
+
+    __slots__ = ("hand_id", "dealer_pos", "starting_stacks", "final_stacks",
+                 "action_players", "action_kinds", "action_amounts", "board",
+                 "preflop_end")
+
+    def __init__(self, hand_id, dealer_pos, starting_stacks):
+        self.hand_id = hand_id
+        self.dealer_pos = dealer_pos
+        self.starting_stacks = starting_stacks
+        self.final_stacks = ()
+        self.action_players = array.array("i")
+        self.action_kinds = array.array("b")
+        self.action_amounts = array.array("i")
+        self.board = ()
+        # Index of the first post-flop action; None until the flop is dealt
+        # (hands that end preflop finalize it to the action count)
+        self.preflop_end = None
+
+    def record(self, player_idx, token):
+        """Append one decision, encoding the token as (kind, amount) ints."""
+        if token.startswith("raise_to"):
+            kind = ACTION_RAISE
+            try:
+                amount = int(token[token.index(":") + 1:])
+            except ValueError:
+                amount = 0
+        else:
+            kind = _ACTION_KIND.get(token, ACTION_FOLD)
+            amount = 0
+        self.action_players.append(player_idx)
+        self.action_kinds.append(kind)
+        self.action_amounts.append(amount)
+
+
+def _vpip_pfr(hand_log, player_idx):
+    """Compute VPIP/PFR hand counts for one player from the columnar log.
+
+    Concatenates the HandLog integer columns and lets the voluntary-action
+    and raise masks run as vectorized NumPy ops - no per-row dict access.
+    """
+    if not hand_log:
+        return 0, 0
+
+    pids = np.concatenate([np.asarray(h.action_players) for h in hand_log])
+    kinds = np.concatenate([np.asarray(h.action_kinds) for h in hand_log])
+    hids = np.concatenate([
+        np.full(len(h.action_players), h.hand_id, dtype=np.int32) for h in hand_log
+    ])
+    # Preflop membership comes straight from the recorded boundary - no
+    # rescanning of actions for board-dealing markers
+    preflop = np.concatenate([
+        np.arange(len(h.action_players)) < (
+            len(h.action_players) if h.preflop_end is None else h.preflop_end
+        )
+        for h in hand_log
+    ])
+    if pids.size == 0:
+        return 0, 0
+
+    mine = (pids == player_idx) & preflop
+    # Voluntary money in = preflop call or raise; folds and checks (and the
+    # blinds, which are posted automatically) don't count
+    vpip = np.unique(hids[mine & (kinds >= ACTION_CALL)]).size
+    pfr = np.unique(hids[mine & (kinds == ACTION_RAISE)]).size
+    return vpip, pfr
+
+# Decision cache settings - repeated spots (especially preflop) produce identical
+# prompts, so caching responses skips entire LLM round-trips on hits.
+DECISION_CACHE_SIZE = 4096
+DECISION_CACHE_PATH = Path.home() / ".cache" / "poker_llm" / "decisions.pkl"
+
+# Append-only hand journal - each completed hand is one JSONL line, fsync'd so
+# a crash mid-run loses at most the hand in progress. On startup we resume
+# from the last journaled hand instead of replaying the whole session.
+HAND_LOG_PATH = "hands.jsonl"
 
 ############################################################
 # ───────────────  PROMPT ADAPTER  ─────────────────────────
@@ -64,61 +195,98 @@ LEGAL_TOKEN_RE = re.compile(r"^(fold|check|call|raise_to:\s*\d+)$")
 
 class PromptAdapter:
     """Helpers for state → prompt and token → state transition."""
+    STREET_NAMES = {0: "Pre flop", 1: "Flop", 2: "Turn", 3: "River"}
+
+    # Operation class → formatter. A dict keyed on the class object is an O(1)
+    # lookup and avoids re-materializing type(op).__name__ for every operation.
+    _OP_FMT = {
+        BoardDealing: lambda op: f"Dealt cards={op.cards}",
+    }
+
+    @staticmethod
+    def _default_op_fmt(op):
+        # Typical PokerKit operation classes: Folding, CheckingOrCalling, CompletionBettingOrRaisingTo, etc.
+        if hasattr(op, "player_index") and hasattr(op, "amount"):
+            return f"{type(op).__name__}(player={op.player_index}, amount={op.amount})"
+        return None
+
+    @staticmethod
+    def _action_str(op):
+        return PromptAdapter._OP_FMT.get(type(op), PromptAdapter._default_op_fmt)(op)
+
     @staticmethod
     def visible_state(st, player: int) -> Dict[str, Any]:
+        # Most fields only change when the street advances or new operations
+        # land, so per-state caches (stored on the pokerkit state itself) keep
+        # each call at O(new operations) instead of rebuilding everything.
         def card_str_list(cards):
             return [str(card) for card in cards]
 
-        def action_str(op):
-        # Typical PokerKit operation classes: Folding, CheckingOrCalling, CompletionBettingOrRaisingTo, etc.
-            cls = type(op).__name__
-            if cls == 'BoardDealing':
-                return f"Dealt cards={op.cards}"
-            if hasattr(op, "player_index") and hasattr(op, "amount"):
-                return f"{cls}(player={op.player_index}, amount={getattr(op, 'amount', None)})"
-            else:
-                return None
-
-        street_map = {0: "Pre flop", 1: "Flop", 2: "Turn", 3: "River"}
-        street_name = street_map.get(st.street_index, "Unknown")
+        # Incrementally extend the cached formatted history
+        ops = st.operations
+        history = getattr(st, "_pa_history", None)
+        if history is None:
+            history = []
+            st._pa_history = history
+            st._pa_history_len = 0
+        if len(ops) > st._pa_history_len:
+            action_str = PromptAdapter._action_str
+            for op in ops[st._pa_history_len:]:
+                formatted = action_str(op)
+                if formatted is not None:
+                    history.append(formatted)
+            st._pa_history_len = len(ops)
+
+        # Street name and board only change at street boundaries
+        if getattr(st, "_pa_street", None) != st.street_index:
+            st._pa_street = st.street_index
+            st._pa_street_name = PromptAdapter.STREET_NAMES.get(st.street_index, "Unknown")
+            st._pa_board = card_str_list(st.get_board_cards(0))
 
         if st.can_complete_bet_or_raise_to(st.min_completion_betting_or_raising_to_amount):
             min_raise = st.min_completion_betting_or_raising_to_amount
         else:
             min_raise = 'Cannot Raise'
 
-        # --- Position logic ---
+        # --- Position logic (invariant per player for the whole hand) ---
         # We need to know the dealer position and the mapping from state index to actual player
         # We'll assume the orchestrator sets: st.dealer_position and st.players (if not, fallback to heads-up default)
-        try:
-            dealer_position = st.dealer_position
-            player_count = len(st.stacks)
-            # Map state player index to actual player index
-            actual_player_idx = (player + dealer_position) % player_count
-            # For heads-up: player 0 is Button (SB), player 1 is BB
-            if player_count == 2:
+        positions = getattr(st, "_pa_positions", None)
+        if positions is None:
+            positions = {}
+            st._pa_positions = positions
+        position = positions.get(player)
+        if position is None:
+            try:
+                dealer_position = st.dealer_position
+                player_count = len(st.stacks)
+                # Map state player index to actual player index
+                actual_player_idx = (player + dealer_position) % player_count
+                # For heads-up: player 0 is Button (SB), player 1 is BB
+                if player_count == 2:
+                    position = "Button" if player == 0 else "Big Blind"
+                else:
+                    # For more players, you can expand this mapping as needed
+                    pos_names = ["Button", "Small Blind", "Big Blind", "UTG", "Hijack", "Cutoff"]
+                    position = pos_names[player % len(pos_names)]
+            except Exception:
+                # Fallback for robustness
                 position = "Button" if player == 0 else "Big Blind"
-            else:
-                # For more players, you can expand this mapping as needed
-                pos_names = ["Button", "Small Blind", "Big Blind", "UTG", "Hijack", "Cutoff"]
-                position = pos_names[player % len(pos_names)]
-        except Exception:
-            # Fallback for robustness
-            position = "Button" if player == 0 else "Big Blind"
+            positions[player] = position
 
         return {
-        "Current Street": street_name,
+        "Current Street": st._pa_street_name,
         "Position": position,
             # "button": st.button_index,  # Only include if you track button_index elsewhere
         # "actor": player,
-        "board": card_str_list(st.get_board_cards(0)),
+        "board": st._pa_board,
         "Hole Cards": card_str_list(st.hole_cards[player]),
         "Your stack": st.stacks[player],
         "Opponent stack": st.stacks[1 - player],
         "Pot size": st.total_pot_amount,
         "to_call": st.checking_or_calling_amount if st.can_check_or_call() else 0,
         "min_raise_to": (min_raise),
-        "history": [action_str(op) for op in st.operations if action_str(op)  is not None]
+        "history": history.copy(),
             }
 
     @staticmethod
@@ -140,12 +308,15 @@ class PromptAdapter:
 
     @staticmethod
     def apply_token(st, tok: str):
-        if tok == "fold":
-            st.fold()
-        elif tok.startswith("check") or tok.startswith("call"):
+        # Hot per-turn kernel: branches ordered by frequency (check/call is
+        # the most common action) and the raise amount is sliced out directly
+        # instead of allocating a split list (int() tolerates the whitespace).
+        if tok.startswith("check") or tok.startswith("call"):
             st.check_or_call()
+        elif tok == "fold":
+            st.fold()
         elif tok.startswith("raise_to"):
-            st.complete_bet_or_raise_to(int(tok.split(":")[1].strip()))
+            st.complete_bet_or_raise_to(int(tok[tok.index(":") + 1:]))
         else:
             raise ValueError(tok)
 
@@ -156,12 +327,23 @@ class PromptAdapter:
 class Orchestrator:
     """Runs one table for `hands` hands."""
 
-    def __init__(self, hands: int = 1):
+    def __init__(self, hands: int = 1, limiters: Dict[str, "RateLimiter"] = None,
+                 log_path: str = HAND_LOG_PATH):
         self.hands = hands
         self.rng = random.Random(RNG_SEED)
+        # Optional per-provider rate limiters (shared across tables by the
+        # Scheduler) pacing and bounding concurrent in-flight LLM calls
+        self._limiters = limiters or {}
+        # One keep-alive connection pool per provider, shared by every player
+        # on this table so repeated LLM calls skip the TCP+TLS handshake
+        self._http = {
+            "openai": _make_http_client(),
+            "anthropic": _make_http_client(),
+        }
         # Replace LLMThread with Player instances
         self.players = [
             Player("Mr.Altman", "openai", OPENAI_MODEL, initial_stack=400,
+                  http_client=self._http["openai"],
                   system_prompt="""You are the most aggresive talented and skilled professional No limit Texas Holdem poker player, evaluating the current game state and making the decision to fold, check, call, or raise to win as much money as possible.
                   
                   Response format: Output must be: <action>[optional integer]@<brief reason>. No other characters, no markdown. If you're raising, the optional integer range will be provided to you in the legal tokens. Explain your thinking but separate it from the token with a preceding '@' symbol
@@ -175,6 +357,7 @@ class Orchestrator:
                   """
                  ),
             Player("Mr.Claude", "anthropic", ANTHROPIC_MODEL, initial_stack=400,
+                  http_client=self._http["anthropic"],
                   system_prompt="""You are the most aggresive talented and skilled professional No limit Texas Holdem poker player, evaluating the current game state and making the decision to fold, check, call, or raise to win as much money as possible.
                   
                   Response format: Output must be: <action>[optional integer]@<brief reason>. No other characters, no markdown. If you're raising, the optional integer range will be provided to you in the legal tokens. Explain your thinking but separate it from the token with a preceding '@' symbol
@@ -192,6 +375,174 @@ class Orchestrator:
         self.dealer_position = 0
         # Initialize illegal moves counter
         self.illegal_moves_count = 0
+        # Columnar per-hand logs consumed by the stats pass in run()
+        self.hand_log: List[HandLog] = []
+        # LRU cache of LLM decisions keyed by (model, game_state, legal tokens).
+        # Loaded from disk so repeated spots across runs also skip the API call.
+        self._decision_cache = self._load_decision_cache()
+        # Speculative decision prefetch: while one player's LLM call is in
+        # flight we guess they will check/call and pre-fetch the opponent's
+        # next decision in parallel, overlapping the two network round-trips.
+        self._spec_key = None
+        self._spec_task = None
+        # Card → emoji rendering tables, built once instead of parsed per call
+        self._emoji = self._build_emoji_table()
+        self._hole_emojis = {}
+        # Append-only hand journal with checkpoint recovery: restore stacks
+        # and the hand counter from any prior run's journal, then keep
+        # appending to the same file.
+        self._log_path = log_path
+        self._hands_done = self._resume_from_log()
+        self._log_fh = open(log_path, "ab")
+
+    @staticmethod
+    def _decision_cache_key(player, game_state, legal):
+        """Hash the canonicalized decision inputs into a compact cache key."""
+        payload = fast_json.dumps(
+            {"m": player.model, "s": game_state, "l": list(legal)},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _resume_from_log(self):
+        """Restore session state from the hand journal, returning hands done.
+
+        Each journal line is one completed hand, so the last line tells us
+        where to pick up: its final stacks (recorded in position order) are
+        mapped back to player indices via the hand's dealer position, and the
+        button advances one seat for the next hand.
+        """
+        try:
+            with open(self._log_path, "rb") as fh:
+                lines = [ln for ln in fh if ln.strip()]
+        except OSError:
+            return 0
+        if not lines:
+            return 0
+        last = fast_json.loads(lines[-1])
+        n = len(self.players)
+        dealer = last["dealer_position"]
+        for pos, stack in enumerate(last["result"]["final_stacks"]):
+            self.players[(pos + dealer) % n].update_stack(stack)
+        self.dealer_position = (dealer + 1) % n
+        return last["hand_id"]
+
+    @staticmethod
+    def _load_decision_cache():
+        """Load the persisted decision cache, or start empty if unavailable."""
+        try:
+            with open(DECISION_CACHE_PATH, "rb") as fh:
+                cached = pickle.load(fh)
+            return collections.OrderedDict(cached)
+        except Exception:
+            return collections.OrderedDict()
+
+    def _save_decision_cache(self):
+        """Persist the decision cache so future runs can reuse responses."""
+        try:
+            DECISION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(DECISION_CACHE_PATH, "wb") as fh:
+                pickle.dump(self._decision_cache, fh)
+        except Exception as e:
+            print(f"Warning: could not persist decision cache: {e}")
+
+    async def _cached_decision(self, player, game_state, legal):
+        """Return a cached response for this exact spot, or ask the LLM and cache it."""
+        key = self._decision_cache_key(player, game_state, legal)
+        hit = self._decision_cache.get(key)
+        if hit is not None:
+            self._decision_cache.move_to_end(key)
+            return hit[0]
+
+        rsp = await self._call_player(player, game_state, legal)
+        self._store_decision(key, rsp)
+        return rsp
+
+    async def _call_player(self, player, game_state, legal):
+        """Invoke a player's LLM call under its provider's rate/concurrency limit."""
+        limiter = self._limiters.get(getattr(player, "provider", None))
+        if limiter is None:
+            return await player.make_decision(game_state, legal)
+        async with limiter:
+            return await player.make_decision(game_state, legal)
+
+    def _store_decision(self, key, rsp):
+        """Insert a response into the LRU cache, evicting the oldest entry if full."""
+        # Store as a 1-tuple so the full response (action + commentary) survives.
+        self._decision_cache[key] = (rsp,)
+        if len(self._decision_cache) > DECISION_CACHE_SIZE:
+            self._decision_cache.popitem(last=False)
+
+    def _launch_speculation(self, st, acting_state_idx):
+        """Start a speculative decision call for the non-acting player.
+
+        Assumes the acting player will check/call; if the guess is right the
+        opponent's response is already in flight when their turn comes up.
+        """
+        try:
+            spec_st = copy.deepcopy(st)
+            if not spec_st.can_check_or_call():
+                return
+            spec_st.check_or_call()
+            nxt = spec_st.actor_index
+            if nxt is None or nxt == acting_state_idx:
+                return
+            spec_legal = PromptAdapter.legal_tokens(spec_st)
+            spec_state = PromptAdapter.visible_state(spec_st, nxt)
+            actual_idx = (nxt + self.dealer_position) % len(self.players)
+            spec_player = self.players[actual_idx]
+            self._spec_key = self._decision_cache_key(spec_player, spec_state, spec_legal)
+            self._spec_task = asyncio.create_task(
+                self._call_player(spec_player, spec_state, spec_legal)
+            )
+        except Exception:
+            # Speculation is best-effort; any failure just means a normal call later
+            self._spec_key = None
+            self._spec_task = None
+
+    async def _discard_speculation(self):
+        """Cancel and drain any outstanding speculative call."""
+        task = self._spec_task
+        self._spec_key = None
+        self._spec_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def aclose(self):
+        """Close the hand journal and the shared HTTP connection pools."""
+        try:
+            self._log_fh.close()
+        except Exception:
+            pass
+        for client in self._http.values():
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+    async def _decide_with_speculation(self, player, game_state, legal, st, plr_idx):
+        """Resolve a decision, consuming a matching speculative call if one exists."""
+        key = self._decision_cache_key(player, game_state, legal)
+        task = self._spec_task
+        if task is not None and self._spec_key == key:
+            self._spec_key = None
+            self._spec_task = None
+            try:
+                rsp = await task
+            except (asyncio.CancelledError, Exception):
+                rsp = None
+            if rsp is not None:
+                self._store_decision(key, rsp)
+                return rsp
+        else:
+            await self._discard_speculation()
+
+        # Kick off the guess for the opponent's next spot, then make the real call;
+        # both network round-trips overlap on the event loop.
+        self._launch_speculation(st, plr_idx)
+        return await self._cached_decision(player, game_state, legal)
 
     # Build a fresh Poker‑Kit state
         # Use the dealer position to determine order of play
@@ -243,28 +594,46 @@ class Orchestrator:
         # This converts the actual player index to their position in this hand
         return (player_idx - self.dealer_position) % len(self.players)
 
+    @staticmethod
+    def _build_emoji_table():
+        """Precompute the emoji rendering for all 52 cards.
+
+        Keys cover both the long form ('EIGHT OF CLUBS (8c)') and the
+        shorthand ('8c'), so one dict lookup replaces the per-call string
+        parsing that used to run on every board/hole-card print.
+        """
+        suit_map = {'s': '♠️', 'h': '♥️', 'd': '♦️', 'c': '♣️'}
+        table = {}
+        for rank in "23456789TJQKA":
+            for suit in "shdc":
+                card = next(iter(Card.parse(f"{rank}{suit}")))
+                emoji = f"{rank}{suit_map[suit]}"
+                table[str(card)] = emoji
+                table[f"{rank}{suit}"] = emoji
+        return table
+
     def card_to_emoji(self, card_str):
-        """Convert a card string like 'AS' or 'Td' to an emoji."""
-        suit_map = {
-            'S': '♠️', 'H': '♥️', 'D': '♦️', 'C': '♣️'
-        }
+        """Convert a card (or its string form) to an emoji via the lookup table."""
+        return self._emoji.get(str(card_str), str(card_str))
+
+    def _cards_to_emojis(self, cards):
+        """Render a card sequence as emojis, caching per unique card tuple."""
+        key = tuple(str(card) for card in cards)
+        cached = self._hole_emojis.get(key)
+        if cached is None:
+            cached = [self._emoji.get(s, s) for s in key]
+            self._hole_emojis[key] = cached
+        return cached
 
-        if not isinstance(card_str, str):
-            card_str = str(card_str)
-        # Card string comes in like 'EIGHT OF CLUBS (8c)'
-        if '(' in card_str and ')' in card_str:
-            # Extract the shorthand notation from inside parentheses
-            card_str = card_str.split('(')[1].split(')')[0]
-            rank, suit = card_str[:-1], card_str[-1]
-            suit = suit.upper()  # Ensure suit is uppercase
-            return f"{rank}{suit_map[suit]}"
 
-   
 
     async def _play_hand(self, hand_no: int):
         st = self._make_state()
-        last_board = []
-        last_stacks = list(st.stacks)
+        # Change detection uses cheap keys: the board only grows at street
+        # boundaries, so (street_index, card_count) identifies it, and stacks
+        # are snapshotted as a tuple instead of a fresh list every iteration.
+        last_board_key = (None, 0)
+        last_stacks = tuple(st.stacks)
         last_history_len = 0
         print(f"\n=== Hand {hand_no} ===")
         
@@ -272,24 +641,33 @@ class Orchestrator:
         players_in_position = self.get_players_in_position_order()
         print(f"Button: {players_in_position[0].name} (SB), BB: {players_in_position[1].name}")
         
-        # Track hand data to provide to players after completion
+        # Track hand data to provide to players after completion.
+        # The actions list is preallocated (typical hands take well under 32
+        # decisions) and filled by index, then trimmed once at hand end.
         hand_data = {
             "hand_id": hand_no,
-            "starting_stacks": last_stacks.copy(),
-            "actions": [],
+            "starting_stacks": last_stacks,
+            "actions": [None] * 32,
+            "preflop_end": None,
             "final_board": [],
             "dealer_position": self.dealer_position,
             "result": {}
         }
+        actions = hand_data["actions"]
+        act_i = 0
+        log = HandLog(hand_no, self.dealer_position, last_stacks)
        
         # Display hole cards at the beginning of the hand
         for i in st.player_indices:
             # Map state player index to actual player index
             actual_player_idx = (i + self.dealer_position) % len(self.players)
             print(f"P{i}, aka {self.players[actual_player_idx].name} hole cards:", 
-                  [self.card_to_emoji(card) for card in list(st.hole_cards[i])])
+                  self._cards_to_emojis(st.hole_cards[i]))
         
         # Betting loop ------------------------------------------------------
+        # Per-turn output is gathered into `buf` and flushed with one
+        # sys.stdout.write per iteration instead of a syscall per print.
+        buf: List[str] = []
         while st.status:
             plr_idx = st.actor_index
             if plr_idx is None:
@@ -301,70 +679,99 @@ class Orchestrator:
             legal = PromptAdapter.legal_tokens(st)
             game_state = PromptAdapter.visible_state(st, plr_idx)
             
-            # Use the player's make_decision method
-            rsp = await self.players[actual_player_idx].make_decision(game_state, legal)
+            # Use the player's make_decision method (through the LRU response
+            # cache, consuming the speculative prefetch when it matches)
+            rsp = await self._decide_with_speculation(
+                self.players[actual_player_idx], game_state, legal, st, plr_idx
+            )
             
-            # Track action in hand history
-            try:
-                rsp, commentary = rsp.split('@')[0].strip(), rsp.split('@')[1]
-                print(player_name +": "+ commentary)
-                hand_data["actions"].append({
-                    "player": actual_player_idx,
-                    "action": rsp,
-                    "commentary": commentary
-                })
-            except ValueError:
-                # Handle case where response doesn't contain the @ symbol
-                rsp = rsp.strip()
-                hand_data["actions"].append({
-                    "player": actual_player_idx,
-                    "action": rsp,
-                    "commentary": ""
-                })
-                
-            # Validate. TODO: eliminate regex and actually use the values in legal
-            if not LEGAL_TOKEN_RE.match(rsp):
-                print(f'!!!!!!!!!!!!!!ILLEGAL MOVE!!!!!!!: {rsp}') # auto‑punish illegal output
-                rsp = "fold" 
-                hand_data["actions"][-1]["action"] = "fold"  # Update to actual action         
-                self.illegal_moves_count += 1      
+            # Track action in hand history; partition() splits once instead
+            # of scanning the response twice (and a missing '@' falls through
+            # cleanly rather than via exception)
+            head, sep, commentary = rsp.partition('@')
+            rsp = head.strip()
+            if sep:
+                buf.append(player_name + ": " + commentary + "\n")
+            else:
+                commentary = ""
+            entry = {
+                "player": actual_player_idx,
+                "action": rsp,
+                "commentary": commentary
+            }
+            if act_i < len(actions):
+                actions[act_i] = entry
+            else:
+                actions.append(entry)
+            act_i += 1
+
+            # Validate. TODO: actually use the values in legal
+            if not _valid_token(rsp):
+                buf.append(f'!!!!!!!!!!!!!!ILLEGAL MOVE!!!!!!!: {rsp}\n') # auto‑punish illegal output
+                rsp = "fold"
+                entry["action"] = "fold"  # Update to actual action
+                self.illegal_moves_count += 1
+            log.record(actual_player_idx, rsp)
             try:               
                 PromptAdapter.apply_token(st, rsp)
+                # Snapshot the state once per iteration; the three change
+                # checks below all work off these locals instead of repeating
+                # attribute traversals on `st`.
+                ops = st.operations
+                stacks_now = tuple(st.stacks)
+                board_key = (st.street_index, len(st.board_cards))
+
                 # Print only new developments:
-                # 1. New board cards
-                board = [str(card) for card in st.get_board_cards(0)]
-                if board != last_board:
-                    print(f"Board: {[self.card_to_emoji(card) for card in board]}")
-                    last_board = board.copy()
-                    hand_data["final_board"] = board.copy()
-                    
+                # 1. New board cards - only re-stringify when the key changes
+                if board_key != last_board_key:
+                    board = [str(card) for card in st.get_board_cards(0)]
+                    if board:
+                        buf.append(f"Board: {self._cards_to_emojis(board)}\n")
+                        hand_data["final_board"] = tuple(board)
+                    last_board_key = board_key
+
                 # 2. New actions
-                if len(st.operations) > last_history_len:
+                if len(ops) > last_history_len:
                     # Define operations to filter out in a tuple
-                    filtered_ops = (BetCollection, CardBurning, HoleDealing, ChipsPulling, BlindOrStraddlePosting)                    
-                    for op in st.operations[last_history_len:]:
+                    filtered_ops = (BetCollection, CardBurning, HoleDealing, ChipsPulling, BlindOrStraddlePosting)
+                    for op in ops[last_history_len:]:
+                        # The first board deal marks the end of preflop; record
+                        # the boundary so stats never rescan the action list
+                        if hand_data["preflop_end"] is None and isinstance(op, BoardDealing):
+                            hand_data["preflop_end"] = act_i
+                            log.preflop_end = act_i
                         # Display hole cards with emojis when they're shown
                         if isinstance(op, HoleCardsShowingOrMucking) and op.hole_cards:
-                            cards_str = [str(card) for card in op.hole_cards]
-                            emoji_cards = [self.card_to_emoji(card) for card in cards_str]
+                            emoji_cards = self._cards_to_emojis(op.hole_cards)
                             actual_player = (op.player_index + self.dealer_position) % len(self.players)
-                            print(f"Player {self.players[actual_player].name} shows: {emoji_cards}")
+                            buf.append(f"Player {self.players[actual_player].name} shows: {emoji_cards}\n")
                         # Filter out specific operation types when printing
                         if not isinstance(op, filtered_ops):
-                            print(f"Action: {op}")
-                last_history_len = len(st.operations)
-                    
+                            buf.append(f"Action: {op}\n")
+                    last_history_len = len(ops)
+
                 # 3. Stack changes
-                if list(st.stacks) != last_stacks:
+                if stacks_now != last_stacks:
                     # Map positions back to player names for clarity
                     players_in_position = self.get_players_in_position_order()
-                    print(f"Stacks: {players_in_position[0].name}={st.stacks[0]}, {players_in_position[1].name}={st.stacks[1]}")
-                    last_stacks = list(st.stacks)
+                    buf.append(f"Stacks: {players_in_position[0].name}={stacks_now[0]}, {players_in_position[1].name}={stacks_now[1]}\n")
+                    last_stacks = stacks_now
 
             except Exception as e:
-                print(f"Error occurred while processing hand {hand_no}: {e}")
+                print(f"Error occurred while processing hand {hand_no}: {e}", flush=True)
                 st.fold()
-                
+
+            # Flush this turn's buffered output in a single write
+            if buf:
+                sys.stdout.write("".join(buf))
+                buf.clear()
+
+        # The hand is over; trim the preallocated actions list to what was used
+        # and drop any in-flight speculative call (it's now stale)
+        hand_data["actions"] = actions[:act_i]
+        if hand_data["preflop_end"] is None:
+            hand_data["preflop_end"] = act_i
+        await self._discard_speculation()
 
         # Showdown & settle pots -------------------------------------------
         # Map positions back to player names for the final result
@@ -376,10 +783,21 @@ class Orchestrator:
         
         # Update hand result data
         hand_data["result"] = {
-            "final_stacks": list(st.stacks),
+            "final_stacks": tuple(st.stacks),
             "profit_p0": st.stacks[0] - hand_data["starting_stacks"][0],
             "profit_p1": st.stacks[1] - hand_data["starting_stacks"][1],
         }
+
+        # Finalize the columnar log for the stats pass
+        log.final_stacks = hand_data["result"]["final_stacks"]
+        log.board = hand_data["final_board"]
+        self.hand_log.append(log)
+
+        # Journal the completed hand; the fsync makes the line durable so a
+        # crash costs at most the hand in progress
+        self._log_fh.write(fast_json.dumps(hand_data, default=str) + b"\n")
+        self._log_fh.flush()
+        os.fsync(self._log_fh.fileno())
         
         # Update player stacks and memory
         for idx, player in enumerate(players_in_position):
@@ -392,16 +810,24 @@ class Orchestrator:
     async def run(self):
         # Reset illegal moves counter for this session
         self.illegal_moves_count = 0
-        for h in range(1, self.hands + 1):
-            # Check if any player is eliminated before starting the hand
-            active_players = [p for p in self.players if p.stack > 0]
-            if len(active_players) < 2:
-                eliminated_players = [p.name for p in self.players if p.stack == 0]
-                print(f"\nGame ended early: Players eliminated: {eliminated_players}")
-                print(f"Remaining hands skipped: {self.hands - h}")
-                break
-                
-            await self._play_hand(h)
+        if self._hands_done:
+            print(f"Resuming from hand {self._hands_done} in {self._log_path}")
+        try:
+            for h in range(self._hands_done + 1, self.hands + 1):
+                # Check if any player is eliminated before starting the hand
+                active_players = [p for p in self.players if p.stack > 0]
+                if len(active_players) < 2:
+                    eliminated_players = [p.name for p in self.players if p.stack == 0]
+                    print(f"\nGame ended early: Players eliminated: {eliminated_players}")
+                    print(f"Remaining hands skipped: {self.hands - h}")
+                    break
+
+                await self._play_hand(h)
+        finally:
+            # Persist the decision cache so the next run reuses these responses
+            self._save_decision_cache()
+            # Close the shared per-provider connection pools
+            await self.aclose()
         
         # Print overall performance
         print("\n=== Overall Performance ===")
@@ -417,53 +843,10 @@ class Orchestrator:
         for player_idx, player in enumerate(self.players):
             hand_counts[player_idx] = len(player.hand_history)
         
-        # Reset and properly calculate VPIP and PFR by tracking each player correctly
+        # Calculate VPIP and PFR for each player with the vectorized NumPy pass
+        # over the columnar hand log
         for idx, player in enumerate(self.players):
-            # Each player gets one VPIP count per hand where they voluntarily put in money
-            vpip_per_hand = set()  # Track hands where this player voluntarily put in
-            pfr_per_hand = set()   # Track hands where this player raised preflop
-            
-            for hand in player.hand_history:
-                hand_id = hand["hand_id"]
-                dealer_pos = hand.get("dealer_position", 0)
-                
-                # Track preflop actions only
-                is_preflop_action = True
-                
-                for action in hand["actions"]:
-                    player_idx = action["player"]
-                    action_type = action["action"]
-                    
-                    # Skip actions by other players
-                    if player_idx != idx:
-                        continue
-                        
-                    # Check if we're still in preflop
-                    if not is_preflop_action:
-                        continue
-                        
-                    # Check if this is where flop is dealt (end of preflop)
-                    if "Dealt cards=" in action_type:
-                        is_preflop_action = False
-                        continue
-                    
-                    # Only count voluntary actions (not blinds/checks)
-                    if action_type not in ["fold", "check"]:
-                        vpip_per_hand.add(hand_id)
-                    
-                    # Count raises specifically
-                    if action_type.startswith("raise_to:"):
-                        pfr_per_hand.add(hand_id)
-                
-                # After processing actions, check if flop was dealt
-                for action in hand["actions"]:
-                    if "Dealt cards=" in action.get("action", ""):
-                        is_preflop_action = False
-                        break
-            
-            # Now count unique hands where player took these actions
-            vpip_counts[idx] = len(vpip_per_hand)
-            pfr_counts[idx] = len(pfr_per_hand)
+            vpip_counts[idx], pfr_counts[idx] = _vpip_pfr(self.hand_log, idx)
         
         # Print performance stats
         for idx, player in enumerate(self.players):
@@ -495,11 +878,86 @@ class Orchestrator:
         if total_profit != 0:
             print(f"Warning: Total profit ({total_profit}) should be zero in a zero-sum game")
 
+############################################################
+# ─────────────────  TABLE SCHEDULER  ──────────────────────
+############################################################
+
+class RateLimiter:
+    """Token-bucket pacing plus a concurrency cap for one provider.
+
+    The semaphore bounds in-flight calls while the bucket spaces request
+    starts at the target requests-per-second, so a burst of tables ramps up
+    to the provider ceiling without tripping 429s.
+    """
+
+    def __init__(self, rps: float = 4.0, concurrency: int = 4):
+        self.rps = rps
+        self.sem = asyncio.Semaphore(concurrency)
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.sem.acquire()
+        now = time.monotonic()
+        wait = self._next_start - now
+        self._next_start = max(now, self._next_start) + 1.0 / self.rps
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.sem.release()
+
+
+class Scheduler:
+    """Runs several independent tables concurrently.
+
+    Each table stays serial internally (stacks carry across hands), but the
+    LLM waits of all tables overlap on the event loop. Per-provider
+    semaphores shared across tables cap the total in-flight calls so we
+    scale up to - but not past - provider rate limits.
+    """
+
+    def __init__(self, tables: int = 1, hands: int = 20, concurrency: int = 4,
+                 rps: float = 4.0):
+        limiters = {
+            provider: RateLimiter(rps=rps, concurrency=concurrency)
+            for provider in ("openai", "anthropic")
+        }
+        # Each table journals to its own file so resume works per table
+        self.tables = [
+            Orchestrator(
+                hands=hands,
+                limiters=limiters,
+                log_path=HAND_LOG_PATH if tables == 1 else f"hands_table{i}.jsonl",
+            )
+            for i in range(tables)
+        ]
+
+    async def run(self):
+        await asyncio.gather(*(table.run() for table in self.tables))
+
 #######################################################################
 # ─────────────────────  CLI ENTRY POINT  ─────────────────────────────
 #######################################################################
 
 if __name__ == "__main__":
-    hands_to_play = 20
-    orch = Orchestrator(hands=hands_to_play)
-    asyncio.run(orch.run())
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run LLM-vs-LLM poker tables")
+    parser.add_argument("--hands", type=int, default=20, help="hands per table")
+    parser.add_argument("--tables", type=int, default=1, help="tables to run concurrently")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="max in-flight LLM calls per provider across all tables")
+    parser.add_argument("--rps", type=float, default=4.0,
+                        help="target requests per second per provider")
+    args = parser.parse_args()
+
+    # Block-buffer stdout so the per-turn batched writes aren't flushed line
+    # by line when running under a terminal
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError):
+        pass
+    scheduler = Scheduler(tables=args.tables, hands=args.hands,
+                          concurrency=args.concurrency, rps=args.rps)
+    asyncio.run(scheduler.run())
@@ -1,101 +1,405 @@
 """Utility class to convert PokerKit actions into human-readable text."""
 
+import functools
+import sys
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence
+
+from pokerkit.state import (
+    AntePosting,
+    BetCollection,
+    BlindOrStraddlePosting,
+    BoardDealing,
+    CardBurning,
+    CheckingOrCalling,
+    ChipsPulling,
+    ChipsPushing,
+    CompletionBettingOrRaisingTo,
+    Folding,
+    HandKilling,
+    HoleCardsShowingOrMucking,
+    HoleDealing,
+    RunoutCountSelection,
+)
+
+
+# Fallback labels, built and interned once; tables top out around ten seats,
+# so the common path never allocates a fresh "Player N" string
+_DEFAULT_NAMES = tuple(sys.intern(f"Player {i}") for i in range(16))
+
+
+def _pname(player_index: int, player_names: Optional[Sequence[str]]) -> str:
+    """Get the player's display name or fall back to "Player X"."""
+    if player_names and 0 <= player_index < len(player_names):
+        return player_names[player_index]
+    if type(player_index) is int and 0 <= player_index < len(_DEFAULT_NAMES):
+        return _DEFAULT_NAMES[player_index]
+    return f"Player {player_index}"
+
+
+def _names_tuple(player_names: Optional[Sequence[str]]) -> Optional[tuple]:
+    """Normalize caller-supplied names to an interned, hashable tuple.
+
+    Interning means repeated renders with the same roster hash and compare
+    the tuples via pointer-equal strings in the memo key.
+    """
+    if not player_names:
+        return None
+    return tuple(map(sys.intern, player_names))
+
+
+# Bet sizes repeat heavily within a session (blinds, min-raises, pot-sized
+# bets), so cache their string forms instead of re-running int formatting
+# for every rendered action
+_amount_str = functools.lru_cache(maxsize=256)(str)
+
+# There are only 52 distinct cards and PokerKit's Card is hashable, so every
+# card render after the first is a dict hit instead of a __str__ call
+_card_str = functools.lru_cache(maxsize=64)(str)
+
+# Winner-line prefix, interned once rather than re-embedded in each format
+_TROPHY = "\U0001F3C6 "  # "🏆 "
+
+
+def _fold(action, names):
+    return _pname(action.player_index, names) + " folds"
+
+
+def _check_or_call(action, names):
+    amount = getattr(action, 'amount', 0)
+    if amount > 0:
+        return "".join((_pname(action.player_index, names), " calls ", _amount_str(amount)))
+    return _pname(action.player_index, names) + " checks"
+
+
+def _raise_to(action, names):
+    return "".join((_pname(action.player_index, names), " raises to ", _amount_str(action.amount)))
+
+
+def _board_dealing(action, names):
+    return "Board dealt: " + ', '.join(map(str, action.cards))
+
+
+def _hole_dealing(action, names):
+    return _pname(action.player_index, names) + " dealt hole cards"
+
+
+def _blind_posting(action, names):
+    return "".join((_pname(action.player_index, names), " posts blind: ", _amount_str(action.amount)))
+
+
+def _ante_posting(action, names):
+    return "".join((_pname(action.player_index, names), " posts ante: ", _amount_str(action.amount)))
+
+
+def _chips_pulling(action, names):
+    return "".join((_pname(action.player_index, names), " pulls chips: ", _amount_str(action.amount)))
+
+
+def _chips_pushing(action, names):
+    # Handle chips pushing to show who won the hand. Winner lines are built
+    # as one flat fragment list joined once at the end, rather than a list
+    # of per-winner f-strings that a second join walks again
+    if getattr(action, 'amounts', None):
+        frags = [_TROPHY]
+        first = True
+        for i, amount in enumerate(action.amounts):
+            if amount > 0:
+                if not first:
+                    frags.append(' and ')
+                frags.append(_pname(i, names))
+                frags.append(' wins ')
+                frags.append(_amount_str(amount))
+                first = False
+        if first:
+            return "No winners (split pot)"
+        return "".join(frags)
+    return "Chips pushed"
+
+
+def _hand_killing(action, names):
+    return _pname(action.player_index, names) + " mucks hand"
+
+
+def _card_burning(action, names):
+    return "Card burned"
+
+
+def _show_or_muck(action, names):
+    if getattr(action, 'hole_cards', None):
+        return "".join((
+            _pname(action.player_index, names), " shows: ",
+            ', '.join(map(str, action.hole_cards)),
+        ))
+    return _pname(action.player_index, names) + " mucks hand"
+
+
+def _ignore(action, names):
+    # Bookkeeping operations with nothing worth narrating
+    return ""
+
+
+# Sentinel distinguishing "attribute absent" from a falsy value; a single
+# getattr probe replaces the paired hasattr checks (each of which is a full
+# attribute lookup that catches AttributeError internally)
+_MISSING = object()
+
+
+def _fallback(action, names):
+    # Fallback for unknown action types
+    action_type = type(action).__name__
+    print(f"ERROR RENDERING ACTION: {action_type}")
+    player_index = getattr(action, 'player_index', _MISSING)
+    if player_index is _MISSING:
+        return action_type
+    amount = getattr(action, 'amount', _MISSING)
+    if amount is _MISSING:
+        return f"{action_type}: {_pname(player_index, names)}"
+    return f"{action_type}: {_pname(player_index, names)}, Amount {amount}"
+
+
+# Handlers by class name; used to seed the by-class table below and to
+# resolve the Mock* stand-ins the tests pass in ("MockFolding" renders
+# like "Folding")
+_HANDLERS_BY_NAME: Dict[str, Callable] = {
+    'Folding': _fold,
+    'CheckingOrCalling': _check_or_call,
+    'CompletionBettingOrRaisingTo': _raise_to,
+    'BoardDealing': _board_dealing,
+    'HoleDealing': _hole_dealing,
+    'BlindOrStraddlePosting': _blind_posting,
+    'AntePosting': _ante_posting,
+    'ChipsPulling': _chips_pulling,
+    'ChipsPushing': _chips_pushing,
+    'HandKilling': _hand_killing,
+    'CardBurning': _card_burning,
+    'HoleCardsShowingOrMucking': _show_or_muck,
+    'BetCollection': _ignore,
+    'RunoutCountSelection': _ignore,
+}
+
+# Known operation classes in a fixed order; the position doubles as the
+# type code stored in ActionLog's columns
+_OP_CLASSES = (
+    Folding,
+    CheckingOrCalling,
+    CompletionBettingOrRaisingTo,
+    BoardDealing,
+    HoleDealing,
+    BlindOrStraddlePosting,
+    AntePosting,
+    ChipsPulling,
+    ChipsPushing,
+    HandKilling,
+    CardBurning,
+    HoleCardsShowingOrMucking,
+    BetCollection,
+    RunoutCountSelection,
+)
+
+# Dispatch keyed on the class object itself: one hash lookup per action
+# instead of materializing type(action).__name__ and scanning an if/elif
+# ladder of list literals on every call
+_HANDLERS: Dict[type, Callable] = {
+    cls: _HANDLERS_BY_NAME[cls.__name__] for cls in _OP_CLASSES
+}
+
+_TYPE_CODES: Dict[type, int] = {cls: i for i, cls in enumerate(_OP_CLASSES)}
+_HANDLERS_BY_CODE = tuple(_HANDLERS_BY_NAME[cls.__name__] for cls in _OP_CLASSES)
+_UNKNOWN_CODE = 255
+
+
+def _resolve(cls: type) -> Callable:
+    """Register an unseen class (e.g. a Mock* test double) on first miss."""
+    name = cls.__name__
+    handler = _HANDLERS_BY_NAME.get(name.removeprefix('Mock'), _fallback)
+    _HANDLERS[cls] = handler
+    return handler
+
+
+class _FrozenAction:
+    """Tuple-keyed stand-in carrying only the attributes handlers read."""
+
+    __slots__ = ('player_index', 'amount', 'cards', 'hole_cards', 'amounts')
+
+    def __init__(self, player_index, amount, cards, hole_cards, amounts):
+        self.player_index = player_index
+        self.amount = amount
+        self.cards = cards
+        self.hole_cards = hole_cards
+        self.amounts = amounts
+
+
+@functools.lru_cache(maxsize=4096)
+def _render(handler, player_index, amount, cards, hole_cards, amounts, names):
+    """Memoized render of one operation.
+
+    Hand histories get re-rendered for every decision prompt, so the same
+    operations come through here over and over; repeated conversions return
+    the cached string instead of re-running the handler.
+    """
+    return handler(
+        _FrozenAction(player_index, amount, cards, hole_cards, amounts), names
+    )
+
+
+_NO_EXTRAS = ((), (), ())
+
+
+class ActionLog:
+    """Column-oriented store of PokerKit operations.
+
+    PokerKit hands back one heap object per operation, so rendering a long
+    history walks N scattered allocations. Appending each operation here up
+    front copies its scalar fields into parallel typed arrays (type code,
+    player index, amount) that stay contiguous in memory; the few operations
+    carrying card lists or payout vectors keep those in a sparse side table.
+    Re-rendering the log — which happens once per LLM turn — then streams
+    three flat columns instead of chasing object pointers.
+    """
+
+    __slots__ = ('type_code', 'player_index', 'amount', '_extras', '_unknown')
+
+    def __init__(self, actions: Optional[Sequence] = None):
+        self.type_code = array('B')
+        self.player_index = array('b')  # -1 marks "no player"
+        self.amount = array('q')
+        # index -> (cards, hole_cards, amounts); most operations carry none
+        self._extras: Dict[int, tuple] = {}
+        # index -> original object, for types without a code (rendered via
+        # the dynamic fallback, which probes attributes)
+        self._unknown: Dict[int, object] = {}
+        if actions:
+            self.extend(actions)
+
+    def __len__(self) -> int:
+        return len(self.type_code)
+
+    def append(self, action) -> None:
+        """Record one operation's fields into the columns."""
+        idx = len(self.type_code)
+        code = _TYPE_CODES.get(type(action))
+        if code is None:
+            code = _UNKNOWN_CODE
+            self._unknown[idx] = action
+        self.type_code.append(code)
+        player_index = getattr(action, 'player_index', None)
+        self.player_index.append(-1 if player_index is None else player_index)
+        self.amount.append(getattr(action, 'amount', 0) or 0)
+        cards = getattr(action, 'cards', None)
+        hole_cards = getattr(action, 'hole_cards', None)
+        amounts = getattr(action, 'amounts', None)
+        if cards or hole_cards or amounts:
+            self._extras[idx] = (
+                tuple(map(_card_str, cards or ())),
+                tuple(map(_card_str, hole_cards or ())),
+                tuple(amounts or ()),
+            )
+
+    def extend(self, actions: Sequence) -> None:
+        append = self.append
+        for action in actions:
+            append(action)
+
+    def render(self, player_names: Optional[Sequence[str]] = None) -> List[str]:
+        """Render every recorded operation, reading the columns in order."""
+        names = _names_tuple(player_names)
+        handlers = _HANDLERS_BY_CODE
+        render = _render
+        extras_get = self._extras.get
+        unknown = self._unknown
+        out = []
+        append = out.append
+        idx = 0
+        for code, player_index, amount in zip(
+            self.type_code, self.player_index, self.amount
+        ):
+            if code == _UNKNOWN_CODE:
+                append(_fallback(unknown[idx], names))
+            else:
+                cards, hole_cards, amounts = extras_get(idx, _NO_EXTRAS)
+                append(render(
+                    handlers[code],
+                    None if player_index < 0 else player_index,
+                    amount,
+                    cards,
+                    hole_cards,
+                    amounts,
+                    names,
+                ))
+            idx += 1
+        return out
+
+
 class ActionConverter:
     """Utility class to convert PokerKit actions into human-readable text."""
-    
+
+    @staticmethod
+    def render_log(log: ActionLog, player_names: Optional[Sequence[str]] = None) -> List[str]:
+        """Render an ActionLog's recorded operations in one pass."""
+        return log.render(player_names)
+
     @staticmethod
-    def to_human_readable(action, player_names=None) -> str:
+    def to_human_readable(action: object, player_names: Optional[Sequence[str]] = None) -> str:
         """Convert a PokerKit action to human-readable text.
-        
+
         Args:
             action: The PokerKit action object
             player_names: Optional list of player names to use instead of "Player X"
         """
         if action is None:
             return None
-            
-        action_type = type(action).__name__
-        
-        # Helper function to get player name or fallback to "Player X"
-        def get_player_name(player_index):
-            if player_names and 0 <= player_index < len(player_names):
-                return player_names[player_index]
-            return f"Player {player_index}"
-        
-        # Handle different action types (including mock classes for testing)
-        if action_type in ['Folding', 'MockFolding']:
-            return f"{get_player_name(action.player_index)} folds"
-            
-        elif action_type in ['CheckingOrCalling', 'MockCheckingOrCalling']:
-            if hasattr(action, 'amount') and action.amount > 0:
-                return f"{get_player_name(action.player_index)} calls {action.amount}"
-            else:
-                return f"{get_player_name(action.player_index)} checks"
-                
-        elif action_type in ['CompletionBettingOrRaisingTo', 'MockCompletionBettingOrRaisingTo']:
-            return f"{get_player_name(action.player_index)} raises to {action.amount}"
-            
-        elif action_type in ['BoardDealing', 'MockBoardDealing']:
-            cards_str = ', '.join(str(card) for card in action.cards)
-            return f"Board dealt: {cards_str}"
-            
-        elif action_type in ['HoleDealing', 'MockHoleDealing']:
-            return f"{get_player_name(action.player_index)} dealt hole cards"
-            
-        elif action_type in ['BlindOrStraddlePosting', 'MockBlindOrStraddlePosting']:
-            return f"{get_player_name(action.player_index)} posts blind: {action.amount}"
-            
-        elif action_type in ['AntePosting', 'MockAntePosting']:
-            return f"{get_player_name(action.player_index)} posts ante: {action.amount}"
-            
-        elif action_type in ['ChipsPulling', 'MockChipsPulling']:
-            return f"{get_player_name(action.player_index)} pulls chips: {action.amount}"
-            
-        elif action_type in ['ChipsPushing', 'MockChipsPushing']:
-            # Handle chips pushing to show who won the hand
-            if hasattr(action, 'amounts') and action.amounts:
-                winners = []
-                for i, amount in enumerate(action.amounts):
-                    if amount > 0:
-                        winners.append(f"{get_player_name(i)} wins {amount}")
-                
-                if winners:
-                    if len(winners) == 1:
-                        return f"🏆 {winners[0]}"
-                    else:
-                        return f"🏆 {' and '.join(winners)}"
-                else:
-                    return "No winners (split pot)"
-            else:
-                return "Chips pushed"
-            
-        elif action_type in ['HandKilling', 'MockHandKilling']:
-            return f"{get_player_name(action.player_index)} mucks hand"
-            
-        elif action_type in ['CardBurning', 'MockCardBurning']:
-            return "Card burned"
-            
-        elif action_type in ['HoleCardsShowingOrMucking', 'MockHoleCardsShowingOrMucking']:
-            if hasattr(action, 'hole_cards') and action.hole_cards:
-                cards_str = ', '.join(str(card) for card in action.hole_cards)
-                return f"{get_player_name(action.player_index)} shows: {cards_str}"
-            else:
-                return f"{get_player_name(action.player_index)} mucks hand"
-
-        # You can ignore these actions
-        elif action_type in ['BetCollection']:
-            return ""
-            
-        elif action_type in ['RunoutCountSelection', 'MockRunoutCountSelection']:
-            # This happens during all-in runout - we can ignore it as it's automatic
-            return ""
-            
-        else:
-            # Fallback for unknown action types
-            print(f"ERROR RENDERING ACTION: {action_type}")
-            if hasattr(action, 'player_index') and hasattr(action, 'amount'):
-                return f"{action_type}: {get_player_name(action.player_index)}, Amount {action.amount}"
-            elif hasattr(action, 'player_index'):
-                return f"{action_type}: {get_player_name(action.player_index)}"
-            else:
-                return f"{action_type}" 
\ No newline at end of file
+        cls = type(action)
+        handler = _HANDLERS.get(cls)
+        if handler is None:
+            handler = _resolve(cls)
+        if handler is _fallback:
+            # Unknown types are rare and probe attributes dynamically, so
+            # render them directly rather than through the memo
+            return _fallback(action, player_names)
+        return _render(
+            handler,
+            getattr(action, 'player_index', None),
+            getattr(action, 'amount', 0),
+            tuple(map(_card_str, getattr(action, 'cards', None) or ())),
+            tuple(map(_card_str, getattr(action, 'hole_cards', None) or ())),
+            tuple(getattr(action, 'amounts', None) or ()),
+            _names_tuple(player_names),
+        )
+
+    @staticmethod
+    def to_human_readable_many(
+        actions: Sequence, player_names: Optional[Sequence[str]] = None
+    ) -> List[str]:
+        """Convert a sequence of actions in one pass.
+
+        Builds the player-name tuple once and binds the dispatch and render
+        lookups to locals, so history-length conversions skip the per-call
+        setup that to_human_readable repeats for every operation.
+        """
+        names = _names_tuple(player_names)
+        hget = _HANDLERS.get
+        render = _render
+        out = []
+        append = out.append
+        for action in actions:
+            if action is None:
+                append(None)
+                continue
+            cls = type(action)
+            handler = hget(cls)
+            if handler is None:
+                handler = _resolve(cls)
+            if handler is _fallback:
+                append(_fallback(action, names))
+                continue
+            append(render(
+                handler,
+                getattr(action, 'player_index', None),
+                getattr(action, 'amount', 0),
+                tuple(map(_card_str, getattr(action, 'cards', None) or ())),
+                tuple(map(_card_str, getattr(action, 'hole_cards', None) or ())),
+                tuple(getattr(action, 'amounts', None) or ()),
+                names,
+            ))
+        return out
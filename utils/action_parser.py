@@ -39,6 +39,14 @@ class InvalidActionError(ValueError):
     """Raised when a player's response cannot be mapped to a legal action."""
 
 
+# Precompiled patterns for the parse hot path - these run on every player
+# response, so compile them once at import instead of per call
+_RAISE_TO_RE = re.compile(r"raise_to\s*[: ]\s*(\d+)")
+_RAISE_RE = re.compile(r"raise\s*[: ]\s*(\d+)")
+_BET_RE = re.compile(r"bet\s*[: ]\s*(\d+)")
+_LEGAL_RAISE_RE = re.compile(r"raise_to\s*:\s*(\d+)(?:\s+to\s+(\d+))?")
+
+
 def parse_player_decision(
     raw_text: str,
     legal_tokens: Iterable[str],
@@ -142,7 +150,7 @@ def _normalize_action(action_text: str) -> tuple[str, Optional[int]]:
         return lowered, None
 
     if lowered.startswith("raise_to"):
-        match = re.search(r"raise_to\s*[: ]\s*(\d+)", lowered)
+        match = _RAISE_TO_RE.search(lowered)
         if not match:
             raise InvalidActionError(f"Could not parse raise amount from '{action_text}'")
         amount = int(match.group(1))
@@ -150,13 +158,13 @@ def _normalize_action(action_text: str) -> tuple[str, Optional[int]]:
 
     # Accept responses like "raise 400"
     if lowered.startswith("raise"):
-        match = re.search(r"raise\s*[: ]\s*(\d+)", lowered)
+        match = _RAISE_RE.search(lowered)
         if match:
             return "raise_to", int(match.group(1))
 
     # Accept "bet" as a synonym for raise
     if lowered.startswith("bet"):
-        match = re.search(r"bet\s*[: ]\s*(\d+)", lowered)
+        match = _BET_RE.search(lowered)
         if match:
             return "raise_to", int(match.group(1))
 
@@ -227,7 +235,7 @@ def _parse_legal_tokens(legal_tokens: Iterable[str]) -> List[LegalAction]:
 
         lowered = raw.lower()
         if lowered.startswith("raise_to"):
-            match = re.search(r"raise_to\s*:\s*(\d+)(?:\s+to\s+(\d+))?", lowered)
+            match = _LEGAL_RAISE_RE.search(lowered)
             if not match:
                 continue
             min_amount = int(match.group(1))
@@ -0,0 +1,67 @@
+"""Persistent exact-match cache for LLM poker decisions.
+
+Identical (model, game state, legal actions) prompts recur constantly in
+early streets - preflop min-raise spots, blind-vs-blind checks - so repeated
+spots can reuse the stored response instead of paying an API round-trip.
+Entries are kept in an LRU-ordered dict and pickled to disk so hits carry
+across runs.
+"""
+
+import collections
+import hashlib
+import pickle
+from pathlib import Path
+
+from utils import fast_json
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "poker_llm" / "main_decisions.pkl"
+
+
+class DecisionCache:
+    """LRU decision cache keyed by hashed prompt inputs, persisted to disk."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, max_entries: int = 4096):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        try:
+            with open(self.path, "rb") as fh:
+                self._entries = collections.OrderedDict(pickle.load(fh))
+        except Exception:
+            self._entries = collections.OrderedDict()
+
+    @staticmethod
+    def key(model: str, game_state: dict, legal, notes: str = "") -> bytes:
+        """Hash the canonicalized decision inputs into a compact cache key.
+
+        Notes are part of the key because they feed the prompt: a player with
+        different accumulated notes may legitimately decide differently.
+        """
+        payload = fast_json.dumps(
+            {"m": model, "s": game_state, "l": list(legal), "n": notes},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get(self, key: bytes):
+        """Return the cached response, refreshing its LRU position."""
+        rsp = self._entries.get(key)
+        if rsp is not None:
+            self._entries.move_to_end(key)
+        return rsp
+
+    def put(self, key: bytes, rsp: str):
+        """Store a response, evicting the least-recently-used entry if full."""
+        self._entries[key] = rsp
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self):
+        """Persist the cache so future runs can reuse responses."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as fh:
+                pickle.dump(self._entries, fh)
+        except Exception as e:
+            print(f"Warning: could not persist decision cache: {e}")
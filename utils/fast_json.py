@@ -0,0 +1,37 @@
+"""JSON helpers that use the C-accelerated orjson when it is installed."""
+
+import json
+
+# Handle optional imports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj, sort_keys: bool = False, default=None) -> bytes:
+    """Serialize to compact UTF-8 bytes.
+
+    orjson emits bytes directly (skipping the separate str → utf-8 encode
+    step) and is several times faster than the stdlib on the small nested
+    dicts used for prompts and hand logs.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, sort_keys=sort_keys, separators=(",", ":"), default=default
+    ).encode()
+
+
+def dumps_str(obj, sort_keys: bool = False, default=None) -> str:
+    """Serialize to a compact JSON string."""
+    return dumps(obj, sort_keys=sort_keys, default=default).decode()
+
+
+def loads(data):
+    """Deserialize JSON from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
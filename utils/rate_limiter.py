@@ -0,0 +1,99 @@
+"""Shared token-bucket rate limiting for LLM providers.
+
+Without pacing, concurrent tables burst straight into provider 429s and the
+resulting retry storms collapse throughput. Each provider gets two buckets -
+requests per minute and (estimated) tokens per minute - shared process-wide
+so every player calling that provider draws from the same budget.
+"""
+
+import asyncio
+import time
+from typing import Dict, Sequence
+
+# Handle optional imports: tiktoken gives exact counts for OpenAI-style BPE
+# vocabularies; without it the chars/4 heuristic below keeps working. The
+# encoding load is also guarded because tiktoken fetches vocab files on first
+# use and that can fail offline.
+try:
+    import tiktoken
+    try:
+        _ENCODING = tiktoken.get_encoding("o200k_base")
+    except Exception:
+        _ENCODING = None
+except ImportError:
+    _ENCODING = None
+
+
+def estimate_tokens(messages: Sequence[Dict[str, str]]) -> int:
+    """Estimate prompt tokens: exact BPE count when tiktoken is available,
+    otherwise ~4 characters per token, plus per-message overhead.
+
+    Counts from one vocabulary are close enough across providers for
+    budgeting against a TPM ceiling.
+    """
+    if _ENCODING is not None:
+        return sum(
+            len(_ENCODING.encode(msg.get("content") or "")) for msg in messages
+        ) + 8 * len(messages)
+    chars = sum(len(msg.get("content") or "") for msg in messages)
+    return chars // 4 + 8 * len(messages)
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously from a per-minute rate."""
+
+    def __init__(self, per_minute: float, capacity: float = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 1):
+        """Block until `tokens` can be drawn from the bucket."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+class ProviderLimiter:
+    """RPM + TPM pacing for one provider."""
+
+    def __init__(self, rpm: float, tpm: float):
+        self.rpm = TokenBucket(rpm)
+        self.tpm = TokenBucket(tpm)
+
+    async def acquire(self, messages: Sequence[Dict[str, str]], max_response_tokens: int = 0):
+        """Reserve one request plus the estimated prompt and response tokens.
+
+        Providers bill generated tokens against the same TPM ceiling, so the
+        caller's response budget (its max_tokens) is reserved up front too.
+        """
+        await self.rpm.acquire(1)
+        await self.tpm.acquire(estimate_tokens(messages) + max_response_tokens)
+
+
+# Conservative default quotas; adjust to the account's actual limits
+_DEFAULT_LIMITS = {
+    "openai": (3500, 90000),
+    "anthropic": (1000, 80000),
+    "gemini": (1000, 120000),
+    "grok": (1000, 80000),
+}
+
+_LIMITERS: Dict[str, ProviderLimiter] = {}
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """Return the process-wide limiter for a provider, creating it lazily."""
+    limiter = _LIMITERS.get(provider)
+    if limiter is None:
+        rpm, tpm = _DEFAULT_LIMITS.get(provider, (1000, 80000))
+        limiter = _LIMITERS[provider] = ProviderLimiter(rpm, tpm)
+    return limiter